@@ -0,0 +1,416 @@
+# battle/battle_ai.py
+#
+# Lookahead enemy AI over the press-turn economy.
+#
+# EnemyAI.decide() runs an expectimax search over the rest of the acting
+# side's turn. A node is the press-turn bar plus every combatant's HP (and
+# the acting side's MP); a skill branches into miss / critical / plain
+# hit with the probabilities and mean damage from a cached MatchupTable,
+# and consumes press turns by the battle_rules (a weakness or critical
+# costs half a turn, a miss two, a null/reflect wipes the bar).
+#
+# Search is iterative deepening under a time budget, so a decision never
+# takes longer than the budget; the best move of the deepest completed
+# pass is returned. A SearchProgress lets another thread read that best
+# move while the search is still running, and cancel it.
+#
+# Matchup tables come from damage_table (NumPy) when it is installed; the
+# game itself does not need NumPy, so without it the same table is built
+# cell by cell from the battle_damage helpers.
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+from constants import ELEMENT_INDEX
+from battle.battle_constants import *
+from battle.battle_damage import (MISS_PRESS_TURN_COST, base_damage, hit_chance,
+                                  hit_press_turn_cost, is_damage_move)
+from battle.battle_rules import apply_press_turn_cost
+
+
+@dataclass(frozen=True)
+class BattleSnapshot:
+    """
+    Copy of what the AI needs, safe to search while the battle goes on.
+        team         the acting side; team[turn_index] acts first
+        foes         the other side
+    """
+    team: Tuple
+    foes: Tuple
+    press_turns: Tuple[int, ...]
+    turn_index: int
+
+    @classmethod
+    def capture(cls, team, foes, press_turns, turn_index):
+        return cls(
+            team=tuple(copy.copy(p) for p in team),
+            foes=tuple(copy.copy(p) for p in foes),
+            press_turns=tuple(press_turns),
+            turn_index=turn_index
+        )
+
+
+@dataclass(frozen=True)
+class AIDecision:
+    move_name: str
+    target_index: int       # index into the snapshot's foes
+    value: float            # expected score of the rest of the turn
+    depth: int              # deepest completed search pass (0 = greedy)
+
+
+class SearchProgress:
+    """
+    Shared between a search and the thread waiting on it: the search
+    writes its best decision after every completed pass; the waiting
+    thread sets cancelled to stop it early.
+    """
+
+    def __init__(self):
+        self.decision = None
+        self.cancelled = False
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _ScalarMatchupTable:
+    """The MatchupTable fields the search reads, as dicts keyed (a, m, d)."""
+    move_names: Tuple[str, ...]
+    hit_chance: dict
+    crit_chance: dict
+    plain_damage: dict
+    crit_damage: dict
+    reflected: dict
+
+
+def _mean_rolled(damage):
+    """Mean of int(damage * roll) over the 16 equally likely rolls."""
+    return sum(int(damage * (roll / 100)) for roll in range(85, 101)) / 16
+
+
+def build_scalar_matchup_table(attackers, move_names, defenders, moves):
+    """damage_table.build_matchup_table without NumPy, one cell at a time."""
+    move_names = tuple(move_names)
+    hit, crit_chance, plain, crit, reflected = {}, {}, {}, {}, {}
+    for m, name in enumerate(move_names):
+        move = moves[name]
+        element = ELEMENT_INDEX[move["element"]]
+        crit_odds = CHANCE_CRIT if move["element"] == "Physical" else 0.0
+        for a, attacker in enumerate(attackers):
+            for d, defender in enumerate(defenders):
+                key = (a, m, d)
+                affinity = defender.affinities[element]
+                hit[key] = 1.0 if affinity >= AFFINITY_NULL else hit_chance(attacker, defender, move)
+                crit_chance[key] = crit_odds
+
+                # On a reflect the defender's damage lands on the attacker
+                reflected[key] = AFFINITY_REFLECT <= affinity < AFFINITY_ABSORB
+                user, target, target_affinity = attacker, defender, affinity
+                if reflected[key]:
+                    user, target = defender, attacker
+                    target_affinity = min(AFFINITY_NULL, attacker.affinities[element])
+                plain[key] = _mean_rolled(base_damage(user, target, move, target_affinity, False))
+                crit[key] = _mean_rolled(base_damage(user, target, move, target_affinity, True))
+
+    return _ScalarMatchupTable(move_names, hit, crit_chance, plain, crit, reflected)
+
+
+def _build_matchup_table(attackers, move_names, defenders, moves):
+    # Imported here so that loading the AI (and the battle) never needs NumPy
+    try:
+        from battle.damage_table import build_matchup_table
+    except ImportError:
+        build_matchup_table = build_scalar_matchup_table
+    return build_matchup_table(attackers, move_names, defenders, moves)
+
+
+def _table_key(team, foes, move_names):
+    def combatant(p):
+        return (p.name, p.pokedex_number, p.level,
+                p.attack_buff, p.defense_buff, p.speed_buff, p.is_guarding)
+    return (tuple(map(combatant, team)), tuple(map(combatant, foes)), move_names)
+
+
+class _Search:
+    """
+    One decide() call: the snapshot's lookup tables, the caches built
+    while searching, and the deadline. Kept apart from EnemyAI so a
+    search abandoned by AIWorker can unwind while the next one runs.
+    """
+
+    def __init__(self, ai, snapshot, deadline, progress):
+        self.deadline = deadline
+        self.progress = progress
+        self.beam_width = ai.beam_width
+        self.team = snapshot.team
+        self.foes = snapshot.foes
+
+        moves = ai.moves
+        known = {name for p in self.team for name in p.moves}
+        self.move_names = tuple(
+            name for name in moves
+            if name in known and is_damage_move(moves[name])
+        )
+        self.table = ai.matchup_table(self.team, self.foes, self.move_names)
+        self.elements = [ELEMENT_INDEX[moves[name]["element"]] for name in self.move_names]
+        self.mp_costs = [moves[name]["mp"] for name in self.move_names]
+        self.team_max_hp = [p.max_hp for p in self.team]
+        self.foe_max_hp = [p.max_hp for p in self.foes]
+
+        # actor → indices of the damaging moves it knows
+        self.known = [
+            [m for m, name in enumerate(self.move_names) if name in p.moves]
+            for p in self.team
+        ]
+        self.outcome_cache = {}
+        self.press_turn_cache = {}
+        self.icon_value = 0.0
+
+    def run(self, snapshot, max_depth):
+        progress = self.progress
+        root = (
+            tuple(float(p.remaining_hp) for p in self.team),
+            tuple(float(p.remaining_hp) for p in self.foes),
+            tuple(p.remaining_mp for p in self.team),
+            tuple(snapshot.press_turns),
+            snapshot.turn_index
+        )
+
+        # Greedy ordering doubles as the fallback if even depth 1 runs out
+        actions = self._ordered_actions(root)
+        if not actions:
+            return None
+        greedy_value, best = actions[0]
+        decision = AIDecision(self.move_names[best[1]], best[2], greedy_value, 0)
+        if progress is not None:
+            progress.decision = decision
+
+        # Rough worth of one more press turn, for cut-off leaves
+        self.icon_value = max(greedy_value, 0.0)
+
+        for depth in range(1, max_depth + 1):
+            try:
+                value, action = max(
+                    ((self._action_value(root, action, depth), action)
+                     for _, action in actions),
+                    key=lambda pair: pair[0]
+                )
+            except _OutOfTime:
+                break
+            decision = AIDecision(self.move_names[action[1]], action[2], value, depth)
+            if progress is not None:
+                progress.decision = decision
+
+        return decision
+
+    def _outcomes(self, a, m, d):
+        """[(probability, mean damage, reflected, press-turn cost)] for a skill."""
+        key = (a, m, d)
+        outcomes = self.outcome_cache.get(key)
+        if outcomes is not None:
+            return outcomes
+
+        t = self.table
+        hit = float(t.hit_chance[a, m, d])
+        crit = float(t.crit_chance[a, m, d])
+        reflected = bool(t.reflected[a, m, d])
+        defender = self.foes[d]
+        affinity = defender.affinities[self.elements[m]]
+
+        outcomes = []
+        if hit < 1.0:
+            outcomes.append((1.0 - hit, 0.0, False, MISS_PRESS_TURN_COST))
+        if hit > 0.0 and crit > 0.0:
+            outcomes.append((hit * crit, float(t.crit_damage[a, m, d]), reflected,
+                             hit_press_turn_cost(affinity, True, defender.is_guarding)))
+        if hit > 0.0 and crit < 1.0:
+            outcomes.append((hit * (1.0 - crit), float(t.plain_damage[a, m, d]), reflected,
+                             hit_press_turn_cost(affinity, False, defender.is_guarding)))
+
+        self.outcome_cache[key] = outcomes
+        return outcomes
+
+    def _actor(self, state):
+        own_hp, foe_hp, own_mp, press_turns, index = state
+        n = len(own_hp)
+        for step in range(n):
+            a = (index + step) % n
+            if own_hp[a] > 0:
+                return a
+        return None
+
+    def _actions(self, state):
+        own_hp, foe_hp, own_mp, press_turns, index = state
+        a = self._actor(state)
+        if a is None:
+            return []
+        return [
+            (a, m, d)
+            for m in self.known[a] if self.mp_costs[m] <= own_mp[a]
+            for d in range(len(foe_hp)) if foe_hp[d] > 0
+        ]
+
+    def _immediate_value(self, state, action):
+        """Expected score of the action alone (no state is built)."""
+        own_hp, foe_hp = state[0], state[1]
+        a, m, d = action
+        total = 0.0
+        for prob, damage, reflected, cost in self._outcomes(a, m, d):
+            if damage <= 0:
+                continue
+            if reflected:
+                taken = min(damage, own_hp[a])
+                score = -taken / self.team_max_hp[a]
+                if taken >= own_hp[a]:
+                    score -= AI_KILL_BONUS
+            else:
+                dealt = min(damage, foe_hp[d])
+                score = dealt / self.foe_max_hp[d]
+                if dealt >= foe_hp[d]:
+                    score += AI_KILL_BONUS
+            total += prob * score
+        return total
+
+    def _ordered_actions(self, state):
+        """[(immediate expected score, action)], best first."""
+        scored = [(self._immediate_value(state, action), action)
+                  for action in self._actions(state)]
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return scored
+
+    def _press_turns_after(self, press_turns, cost):
+        key = (press_turns, cost)
+        result = self.press_turn_cache.get(key)
+        if result is None:
+            result = list(press_turns)
+            apply_press_turn_cost(result, cost)
+            result = self.press_turn_cache[key] = tuple(result)
+        return result
+
+    def _apply(self, state, action, damage, reflected, cost):
+        """Return (next state, score) for one outcome."""
+        own_hp, foe_hp, own_mp, press_turns, index = state
+        a, m, d = action
+
+        score = 0.0
+        if damage > 0:
+            if reflected:
+                taken = min(damage, own_hp[a])
+                score -= taken / self.team_max_hp[a]
+                own_hp = own_hp[:a] + (own_hp[a] - taken,) + own_hp[a + 1:]
+                if own_hp[a] <= 0:
+                    score -= AI_KILL_BONUS
+            else:
+                dealt = min(damage, foe_hp[d])
+                score += dealt / self.foe_max_hp[d]
+                foe_hp = foe_hp[:d] + (foe_hp[d] - dealt,) + foe_hp[d + 1:]
+                if foe_hp[d] <= 0:
+                    score += AI_KILL_BONUS
+
+        if self.mp_costs[m]:
+            own_mp = own_mp[:a] + (own_mp[a] - self.mp_costs[m],) + own_mp[a + 1:]
+
+        press_turns = self._press_turns_after(press_turns, cost)
+        next_state = (own_hp, foe_hp, own_mp, press_turns, (a + 1) % len(own_hp))
+        return next_state, score
+
+    def _action_value(self, state, action, depth):
+        total = 0.0
+        for prob, damage, reflected, cost in self._outcomes(*action):
+            next_state, score = self._apply(state, action, damage, reflected, cost)
+            if depth > 0:
+                score += self._state_value(next_state, depth - 1)
+            total += prob * score
+        return total
+
+    def _state_value(self, state, depth):
+        own_hp, foe_hp, own_mp, press_turns, index = state
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _OutOfTime()
+        if self.progress is not None and self.progress.cancelled:
+            raise _OutOfTime()
+
+        if not any(v > 0 for v in press_turns) or \
+           not any(hp > 0 for hp in foe_hp) or \
+           not any(hp > 0 for hp in own_hp):
+            return 0.0
+
+        if depth == 0:
+            # Cut off: credit the press turns still left on the bar
+            icons = sum(1.0 if v == PRESS_TURN_SOLID else 0.5 for v in press_turns if v > 0)
+            return icons * self.icon_value
+
+        actions = self._ordered_actions(state)[:self.beam_width]
+        if not actions:
+            return 0.0
+        return max(self._action_value(state, action, depth) for _, action in actions)
+
+
+class EnemyAI:
+    """
+    Expectimax enemy AI.
+
+    time_budget is seconds per decision (None = no limit, search to
+    max_depth, which keeps simulations deterministic). Below the root only
+    the beam_width most promising actions are expanded. decide() keeps no
+    state on the instance besides the shared matchup tables, so one
+    EnemyAI can serve overlapping searches.
+    """
+
+    def __init__(self, moves, time_budget=AI_TIME_BUDGET,
+                 max_depth=AI_MAX_DEPTH, beam_width=AI_BEAM_WIDTH):
+        self.moves = moves
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.beam_width = beam_width
+
+        # Matchup tables keyed by both teams' species, levels, buffs and guard
+        self.tables = OrderedDict()
+        self.tables_lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Matchup tables
+    # ---------------------------------------------------------
+    def matchup_table(self, team, foes, move_names):
+        key = _table_key(team, foes, move_names)
+        with self.tables_lock:
+            table = self.tables.get(key)
+            if table is None:
+                table = _build_matchup_table(team, move_names, foes, self.moves)
+                self.tables[key] = table
+                while len(self.tables) > AI_TABLE_CACHE_SIZE:
+                    self.tables.popitem(last=False)
+            else:
+                self.tables.move_to_end(key)
+            return table
+
+    # ---------------------------------------------------------
+    # Decision
+    # ---------------------------------------------------------
+    def decide(self, snapshot, time_budget=None, progress=None):
+        """
+        Pick (move, target) for snapshot.team[snapshot.turn_index], or
+        None if it has nothing to use. progress, if given, is kept up to
+        date with the best decision so far.
+        """
+        if time_budget is None:
+            time_budget = self.time_budget
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        return _Search(self, snapshot, deadline, progress).run(snapshot, self.max_depth)
+
+    # ---------------------------------------------------------
+    # Simulator policy
+    # ---------------------------------------------------------
+    def choose_action(self, team, turn_index, foes, press_turns, moves, rng):
+        """battle_sim policy hook: (move name, target) for team[turn_index]."""
+        decision = self.decide(BattleSnapshot(tuple(team), tuple(foes),
+                                              tuple(press_turns), turn_index))
+        if decision is None:
+            return "Attack", next(p for p in foes if p.remaining_hp > 0)
+        return decision.move_name, foes[decision.target_index]
@@ -0,0 +1,78 @@
+# battle/battle_ai_worker.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from battle.battle_ai import SearchProgress
+from battle.battle_constants import *
+
+
+class AIWorker:
+    """
+    Runs EnemyAI decisions on a background thread so BattleState.update
+    never waits on a search.
+
+    request() hands over a BattleSnapshot; poll() (main thread, once per
+    frame) returns the decision when the search finishes. The search
+    itself keeps to AI_TIME_BUDGET; the deadline is only how long poll()
+    waits. Once it passes, or if the search failed, poll() returns the
+    best decision the search had completed (None if it got nowhere).
+
+    The thread is started on the first request() and stopped by
+    shutdown(); a later request() starts a new one.
+    """
+
+    def __init__(self, ai):
+        self.ai = ai
+        self.executor = None
+        self.future = None
+        self.progress = None
+        self.deadline = 0.0
+
+    @property
+    def thinking(self):
+        return self.future is not None
+
+    def request(self, snapshot, deadline=AI_THINK_DEADLINE):
+        """Start deciding for snapshot; replaces any decision in progress."""
+        self.cancel()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.progress = SearchProgress()
+        self.deadline = time.perf_counter() + deadline
+        self.future = self.executor.submit(self.ai.decide, snapshot,
+                                           AI_TIME_BUDGET, self.progress)
+
+    def poll(self):
+        """The decision once there is one, else None (check `thinking`)."""
+        if self.future is None:
+            return None
+
+        if self.future.done():
+            future = self.future
+            self.future = None
+            try:
+                return future.result()
+            except Exception:
+                # A failed search must not take the game loop down with it
+                return self.progress.decision
+
+        if time.perf_counter() < self.deadline:
+            return None
+
+        # Out of time: take the best completed pass, let the search unwind
+        self.progress.cancelled = True
+        self.future = None
+        return self.progress.decision
+
+    def cancel(self):
+        if self.future is not None:
+            self.progress.cancelled = True
+            self.future.cancel()
+            self.future = None
+
+    def shutdown(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -15,6 +15,32 @@ PLAYER_DEX_NO = -1
 
 FRESH_PRESS_TURNS = [2, 2, 2, 2]
 
+# Skills every wild enemy knows
+ENEMY_MOVES = ("Attack", "Agi", "Bufu", "Zio", "Zan", "Hama", "Mudo")
+
+# Enemy AI (battle_ai): seconds of search per decision (a slice of one
+# frame), lookahead in actions, actions expanded below the root, score
+# for knocking out a combatant (a full HP bar scores 1.0), and how many
+# matchup tables to keep
+AI_TIME_BUDGET      = 0.25 / 30     # a quarter of a frame at TARGET_FPS
+AI_MAX_DEPTH        = 4
+AI_BEAM_WIDTH       = 6
+AI_KILL_BONUS       = 1.0
+AI_TABLE_CACHE_SIZE = 16
+
+# Enemy "thinking" state: the search runs on a worker thread within
+# AI_TIME_BUDGET; BattleState stops waiting on it after AI_THINK_DEADLINE
+# seconds, and shows the thinking text for at least AI_THINK_MIN_FRAMES
+AI_THINK_DEADLINE   = 1.0
+AI_THINK_MIN_FRAMES = 20
+TEXT_ENEMY_THINKING = "{} is thinking"
+
+# Once either side is wiped out the battle ends and the game returns to
+# BATTLE_END_STATE; the next battle starts with fresh teams
+BATTLE_END_STATE = "overworld"
+TEXT_PLAYER_WIPED = "Your team was wiped out..."
+TEXT_ENEMY_WIPED = "The enemy team was defeated!"
+
 STATE_MAIN                                            = 0
 STATE_SKILLS                                          = 1
 STATE_ITEMS                                           = 2
@@ -26,6 +52,10 @@ STATE_PLAYER_SINGLE_TARGET_TARGET                     = 10
 STATE_PLAYER_SINGLE_TARGET_CALC                       = 11
 STATE_PLAYER_SINGLE_TARGET_HP                         = 12
 STATE_COMPLETE_PLAYER_TURN                            = 13
+STATE_ENEMY_THINK                                     = 14
+STATE_ENEMY_SINGLE_TARGET_CALC                        = 15
+STATE_COMPLETE_ENEMY_TURN                             = 16
+STATE_BATTLE_END                                      = 17
 
 MENU_CURSOR_SKILLS_X     = 0
 MENU_CURSOR_SKILLS_Y     = 0
@@ -90,6 +120,9 @@ FONT3_HEIGHT = 13
 FONT3_SCALE = 2
 FONT3_SPACING = 12
 
+# Memory budget for each BattleFont's cache of rendered strings
+FONT_TEXT_CACHE_BUDGET = 2 * 1024 * 1024
+
 ICON_W = 24
 ICON_H = 24
 
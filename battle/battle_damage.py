@@ -0,0 +1,163 @@
+# battle/battle_damage.py
+#
+# Pure damage engine for a single-target skill.
+#
+# Nothing here touches pygame, BattleState or the Pokémon passed in:
+# calculate_damage() only reads the combatants and draws from the given
+# RNG, so it can be run in bulk (balancing, AI lookahead) without the
+# state machine. BattleState applies the result (MP, HP, texts, turns).
+#
+# Combatants are anything with the Pokemon battle attributes (level,
+# attack/defense/spattack/spdefense/speed, *_buff, affinities, potential,
+# is_guarding). Moves are entries of the moves table.
+
+import random
+from dataclasses import dataclass
+from typing import Tuple
+
+from constants import ELEMENT_INDEX
+from battle.battle_constants import *
+
+
+@dataclass(frozen=True, slots=True)
+class DamageResult:
+    """
+    Outcome of one skill use.
+        affinity         defender's affinity to the move's element
+        damage           HP taken by the target (before clamping to 0..max)
+        press_turn_cost  PRESS_TURN_FULL / _HALF / _WIPE, in the order
+                         they are consumed
+    """
+    hit: bool
+    crit: bool
+    reflected: bool
+    affinity: int
+    damage: int
+    press_turn_cost: Tuple[int, ...]
+
+    @property
+    def weak(self):
+        return PRESS_TURN_HALF in self.press_turn_cost
+
+    @property
+    def neutral(self):
+        return self.hit and PRESS_TURN_FULL in self.press_turn_cost
+
+    @property
+    def null(self):
+        return PRESS_TURN_WIPE in self.press_turn_cost
+
+
+# ---------------------------------------------------------
+# Formula pieces
+# ---------------------------------------------------------
+def is_damage_move(move):
+    """True for moves the engine can resolve (single-target attacks)."""
+    return (move["target"] == "Single" and
+            move["type"] in ("Physical", "Special") and
+            move["element"] in ELEMENT_INDEX)
+
+
+def hit_chance(attacker, defender, move):
+    """Accuracy after speed buffs and the speed difference, in 0..1."""
+    odds_hit = move["accuracy"] / 100
+    odds_hit *= DMG_BUFFS_ACC[attacker.speed_buff]
+    odds_hit /= DMG_BUFFS_ACC[defender.speed_buff]
+    atk_norm = (attacker.speed - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
+    def_norm = (defender.speed - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
+    odds_hit *= 1 + (DMG_SPEED_CONSTANT * (atk_norm - def_norm))
+    return max(0.0, min(1.0, odds_hit))
+
+
+def base_damage(user, target, move, target_affinity, is_crit):
+    """
+    Damage before the 85-100% random roll and rounding.
+    user is whoever the damage comes from (the defender on a reflect).
+    """
+    move_element = move["element"]
+    move_type = move["type"]
+
+    damage = move["power"]
+    # atk/def
+    if (move_type == "Physical"):
+        damage *= user.attack
+        damage /= target.defense
+    elif (move_type == "Special"):
+        damage *= user.spattack
+        damage /= target.spdefense
+    damage *= DMG_BUFFS[user.attack_buff]
+    damage /= DMG_BUFFS[target.defense_buff]
+    # level
+    damage *= (((2 * user.level)/5)+2)
+    damage /= 50
+    damage += 2
+    # crit
+    if is_crit:
+        damage *= DMG_CRIT
+    # affinities
+    if ((target_affinity < AFFINITY_NEUTRAL) and \
+        (not target.is_guarding)):
+        damage *= DMG_WEAK
+    if (AFFINITY_RESIST <= target_affinity < AFFINITY_NULL):
+        damage *= DMG_RESIST
+    if (AFFINITY_NULL <= target_affinity < AFFINITY_REFLECT):
+        damage *= DMG_IMMUNE
+    # potentials
+    potential = user.potential[ELEMENT_INDEX[move_element]]
+    damage *= (1.0 + (potential / 18))
+    return damage
+
+
+def hit_press_turn_cost(defender_affinity, is_crit, is_guarding):
+    """Press turns consumed by a hit (a miss always costs two full turns)."""
+    cost = []
+    if (is_crit or (defender_affinity < AFFINITY_NEUTRAL)) and not is_guarding:
+        cost.append(PRESS_TURN_HALF)
+    if (AFFINITY_NEUTRAL <= defender_affinity < AFFINITY_NULL) and not is_crit:
+        cost.append(PRESS_TURN_FULL)
+    if (defender_affinity >= AFFINITY_NULL):
+        cost.append(PRESS_TURN_WIPE)
+    return tuple(cost)
+
+
+MISS_PRESS_TURN_COST = (PRESS_TURN_FULL, PRESS_TURN_FULL)
+
+
+# ---------------------------------------------------------
+# Engine
+# ---------------------------------------------------------
+def calculate_damage(attacker, defender, move, rng=random):
+    """
+    Resolve attacker using move on defender. rng needs random() and
+    randint(); it is drawn from in the same order as the battle always
+    has (hit roll, crit roll, damage roll), so seeded runs line up.
+    """
+    move_element = move["element"]
+    defender_affinity = defender.affinities[ELEMENT_INDEX[move_element]]
+
+    if not ((rng.random() <= hit_chance(attacker, defender, move)) or \
+            (defender_affinity >= AFFINITY_NULL)):
+        return DamageResult(False, False, False, defender_affinity, 0,
+                            MISS_PRESS_TURN_COST)
+
+    is_crit = (rng.random() < CHANCE_CRIT) and (move_element == "Physical")
+    reflected = (AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB)
+    user = attacker
+    target = defender
+    if reflected:
+        user = defender
+        target = attacker
+    target_affinity = target.affinities[ELEMENT_INDEX[move_element]]
+    if reflected:
+        target_affinity = min(AFFINITY_NULL, target_affinity)
+
+    damage = base_damage(user, target, move, target_affinity, is_crit)
+    # random
+    damage *= rng.randint(85, 100) / 100
+    # round
+    damage = int(damage)
+
+    return DamageResult(
+        True, is_crit, reflected, defender_affinity, damage,
+        hit_press_turn_cost(defender_affinity, is_crit, defender.is_guarding)
+    )
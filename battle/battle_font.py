@@ -1,6 +1,7 @@
 import pygame, os
 from constants import *
 from battle.battle_constants import *
+from overworld.asset_cache import AssetCache, surface_bytes
 
 class BattleFont:
     """
@@ -26,6 +27,9 @@ class BattleFont:
         self.glyphs = {}
         self._slice_sheet(sheet)
 
+        # text → pre-rendered run of glyphs (white colorkey), LRU-bounded
+        self.text_cache = AssetCache(FONT_TEXT_CACHE_BUDGET, surface_bytes)
+
     # ---------------------------------------------------------
     # Slice spritesheet into glyphs (scaled × self.scale)
     # ---------------------------------------------------------
@@ -93,13 +97,34 @@ class BattleFont:
     # Draw text
     # ---------------------------------------------------------
 
-    def draw_text(self, screen, text, x, y):
+    def render_text(self, text):
         """
-        Draws text using the scaled bitmap font.
+        Renders text into one surface, glyphs placed exactly as
+        draw_text places them. White is the colorkey, as in the sheet.
         """
-        cx = x
+        glyph_w = self.glyph_w * self.scale
+        width = max(len(text) * self.spacing,
+                    (len(text) - 1) * self.spacing + glyph_w, 1)
+
+        surface = pygame.Surface((width, self.glyph_h * self.scale)).convert()
+        surface.fill(COLOR_WHITE)
+        surface.set_colorkey(COLOR_WHITE, pygame.RLEACCEL)
+
+        cx = 0
         for ch in text:
             glyph = self.glyphs.get(ch)
             if glyph:
-                screen.blit(glyph, (cx, y))
-            cx += self.spacing
\ No newline at end of file
+                surface.blit(glyph, (cx, 0))
+            cx += self.spacing
+
+        return surface
+
+    def draw_text(self, screen, text, x, y):
+        """
+        Draws text using the scaled bitmap font.
+        Each distinct string is rendered once and then blitted whole.
+        """
+        if not text:
+            return
+        run = self.text_cache.get(text, lambda: self.render_text(text))
+        screen.blit(run, (x, y))
@@ -349,6 +349,8 @@ class BattleRenderer:
 
 
         pkmn_for_hpmp = b.player_team[b.turn_index]
+        if not b.is_player_turn:
+            pkmn_for_hpmp = b.player_team[b.enemy_target_index]
         hpmp_y = Y_HPMP
         enemy_hpmp_y = Y_HPMP_ENEMY
         ui_hp_offset = 0
@@ -595,33 +597,9 @@ class BattleRenderer:
             screen.blit(self.cursor_sprite, (cursor_x, cursor_y))
         
         elif b.state == STATE_SCROLL:
-            full_word_lines = self._wrap_text_words(b.scroll_text)
-            visible_chars = int(b.scroll_index)
-            visible_lines = ["","",""]
-            for line_idx, words in enumerate(full_word_lines):
-                for word in words:
-                    chunk = word + " "
-                    if visible_chars >= len(chunk):
-                        visible_lines[line_idx] += chunk
-                        visible_chars -= len(chunk)
-                    else:
-                        visible_lines[line_idx] += chunk[:visible_chars]
-                        visible_chars = 0
-                        break
-                if visible_chars == 0:
-                    break
-            self.font0.draw_text(screen, 
-                                 visible_lines[0], 
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_0)
-            self.font0.draw_text(screen,
-                                 visible_lines[1],
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_1)
-            self.font0.draw_text(screen,
-                                 visible_lines[2],
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_2)
+            b.scroll_layout.draw(screen, self.font0, X_MENU_MAIN,
+                                 (Y_MENU_MAIN_0, Y_MENU_MAIN_1, Y_MENU_MAIN_2),
+                                 b.scroll_index)
             if (b.scroll_is_done) and \
                 (b.scroll_is_input_required) and \
                     (is_blink):
@@ -633,23 +611,14 @@ class BattleRenderer:
                 return
             """
 
+        elif b.state == STATE_ENEMY_THINK:
+            dots = "." * (1 + (self.anim_frame // 10) % 3)
+            self.font0.draw_text(screen, b.think_text + dots,
+                                X_MENU_MAIN, Y_MENU_MAIN_0)
+
         elif b.draw_text_finished:
-            full_word_lines = self._wrap_text_words(b.scroll_text)
-            visible_lines = ["", "", ""]
-            for line_idx, words in enumerate(full_word_lines):
-                visible_lines[line_idx] = " ".join(words) + " "
-            self.font0.draw_text(screen, 
-                                 visible_lines[0], 
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_0)
-            self.font0.draw_text(screen,
-                                 visible_lines[1],
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_1)
-            self.font0.draw_text(screen,
-                                 visible_lines[2],
-                                 X_MENU_MAIN,
-                                 Y_MENU_MAIN_2)
+            b.scroll_layout.draw(screen, self.font0, X_MENU_MAIN,
+                                 (Y_MENU_MAIN_0, Y_MENU_MAIN_1, Y_MENU_MAIN_2))
 
 
         
@@ -793,47 +762,3 @@ class BattleRenderer:
         desc = f"{desc:<12}"
 
         return f"{name_field} {mp}  {element_short}  {power}  {desc}"
-    
-    def _wrap_text_words(self, text, max_width=32):
-        lines = []
-        current = []
-
-        def flush_line():
-            nonlocal current, lines
-            if current:
-                lines.append(current)
-                current = []
-
-        # First, respect explicit newlines
-        segments = text.split("\n")
-
-        for si, segment in enumerate(segments):
-            words = segment.split()
-
-            for word in words:
-                predicted = " ".join(current + [word])
-                if len(predicted) > max_width:
-                    flush_line()
-                    if len(lines) == 3:
-                        return self._pad_lines(lines)
-                    current = [word]
-                else:
-                    current.append(word)
-
-            # After each segment except the last, force a new line
-            if si < len(segments) - 1:
-                flush_line()
-                if len(lines) == 3:
-                    return self._pad_lines(lines)
-
-        # Flush any remaining words
-        flush_line()
-        return self._pad_lines(lines)
-
-
-    def _pad_lines(self, lines):
-        # Ensure exactly 3 lines
-        while len(lines) < 3:
-            lines.append([])
-        return lines[:3]
-
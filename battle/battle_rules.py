@@ -0,0 +1,65 @@
+# battle/battle_rules.py
+#
+# Press-turn and buff bookkeeping shared by BattleState and the headless
+# simulator. Everything works in place on plain lists / Pokémon.
+
+from battle.battle_constants import *
+
+
+# ---------------------------------------------------------
+# Press turns
+# ---------------------------------------------------------
+def consume_full_turn(press_turns):
+    for i in range(len(press_turns)):
+        if press_turns[i] != PRESS_TURN_NULL:
+            press_turns[i] = PRESS_TURN_NULL
+            return
+
+
+def consume_half_turn(press_turns):
+    for i in range(len(press_turns)):
+        if press_turns[i] == PRESS_TURN_SOLID:
+            press_turns[i] = PRESS_TURN_FLASH
+            return
+    for i in range(len(press_turns)):
+        if press_turns[i] == PRESS_TURN_FLASH:
+            press_turns[i] = PRESS_TURN_NULL
+            return
+
+
+def consume_wipe_turn(press_turns):
+    press_turns[:] = [PRESS_TURN_NULL] * len(press_turns)
+
+
+_CONSUME = {
+    PRESS_TURN_FULL: consume_full_turn,
+    PRESS_TURN_HALF: consume_half_turn,
+    PRESS_TURN_WIPE: consume_wipe_turn
+}
+
+
+def apply_press_turn_cost(press_turns, cost):
+    """Consume a DamageResult.press_turn_cost (PRESS_TURN_FULL/_HALF/_WIPE)."""
+    for kind in cost:
+        _CONSUME[kind](press_turns)
+
+
+def has_press_turns(press_turns):
+    return any(v > 0 for v in press_turns)
+
+
+# ---------------------------------------------------------
+# Buffs
+# ---------------------------------------------------------
+def tick_buffs(team):
+    """Count down buff durations at the end of a side's turn."""
+    for e in team:
+        e.attack_buff_turns = max(0, e.attack_buff_turns - 1)
+        e.defense_buff_turns = max(0, e.defense_buff_turns - 1)
+        e.speed_buff_turns = max(0, e.speed_buff_turns - 1)
+        if e.attack_buff_turns == 0:
+            e.attack_buff = 0
+        if e.defense_buff_turns == 0:
+            e.defense_buff = 0
+        if e.speed_buff_turns == 0:
+            e.speed_buff = 0
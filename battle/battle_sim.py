@@ -0,0 +1,301 @@
+# battle/battle_sim.py
+#
+# Headless Monte Carlo battles for balancing species and moves.
+#
+# Run `python -m battle.battle_sim --battles 10000` from the project root.
+# Whole press-turn battles are played with no rendering: the damage
+# engine (battle_damage) resolves each skill and battle_rules does the
+# press-turn and buff bookkeeping, exactly as BattleState does. Battles
+# are seeded individually and spread over a multiprocessing pool.
+
+import argparse
+import multiprocessing
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from battle.battle_ai import EnemyAI
+from battle.battle_constants import *
+from battle.battle_damage import calculate_damage
+from battle.battle_rules import apply_press_turn_cost, has_press_turns, tick_buffs
+from data.smt.game_data import get_game_data
+from data.smt.smt_stats import create_pokemon_from_species
+
+SIDE_PLAYER = 0
+SIDE_ENEMY = 1
+SIDE_NAMES = ("player", "enemy")
+
+# A battle still going after this many side turns is a draw
+MAX_SIDE_TURNS = 200
+
+# EnemyAI lookahead for --enemy-ai (searched to this depth, untimed)
+AI_SIM_DEPTH = 2
+
+
+# ---------------------------------------------------------
+# One battle
+# ---------------------------------------------------------
+@dataclass
+class BattleOutcome:
+    winner: Optional[int]           # SIDE_PLAYER, SIDE_ENEMY or None (draw)
+    side_turns: int
+    damage: List[int]               # every hit's damage, in order
+    species: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+def build_team(species_ids, move_names=ENEMY_MOVES):
+    """Fresh Pokémon at their species level, all knowing move_names."""
+    team = []
+    for species_id in species_ids:
+        p = create_pokemon_from_species(species_id)
+        p.moves = list(move_names)
+        team.append(p)
+    return team
+
+
+def living(team):
+    return [p for p in team if p.remaining_hp > 0]
+
+
+def random_action(team, turn_index, foes, press_turns, moves, rng):
+    """
+    Baseline policy: a random affordable skill on a random living foe.
+    Returns (move name, target).
+    """
+    actor = team[turn_index]
+    affordable = [name for name in actor.moves if moves[name]["mp"] <= actor.remaining_mp]
+    name = rng.choice(affordable) if affordable else "Attack"
+    return name, rng.choice(living(foes))
+
+
+def simulate_battle(player_ids, enemy_ids, rng, policies=(random_action, random_action),
+                    max_side_turns=MAX_SIDE_TURNS):
+    """
+    Play one battle between two teams of species (dex numbers or names).
+    The player side moves first. policies[side](team, turn_index, foes,
+    press_turns, moves, rng) picks each skill and target for that side.
+    """
+    moves = get_game_data().moves
+    teams = (build_team(player_ids), build_team(enemy_ids))
+    species = tuple(tuple(p.pokedex_number for p in team) for team in teams)
+
+    side = SIDE_PLAYER
+    press_turns = FRESH_PRESS_TURNS.copy()
+    turn_index = [0, 0]
+    side_turns = 0
+    damage_dealt = []
+
+    while side_turns < max_side_turns:
+        team = teams[side]
+        foes = teams[1 - side]
+
+        # Next living member of this side acts
+        while team[turn_index[side]].remaining_hp <= 0:
+            turn_index[side] = (turn_index[side] + 1) % len(team)
+        actor = team[turn_index[side]]
+
+        move_name, defender = policies[side](team, turn_index[side], foes,
+                                             press_turns, moves, rng)
+        move = moves[move_name]
+        actor.remaining_mp -= move["mp"]
+
+        result = calculate_damage(actor, defender, move, rng)
+        if result.hit:
+            target = actor if result.reflected else defender
+            hp_target = max(0, target.remaining_hp - result.damage)
+            target.remaining_hp = min(hp_target, target.max_hp)
+            defender.is_guarding = False
+            damage_dealt.append(result.damage)
+        apply_press_turn_cost(press_turns, result.press_turn_cost)
+
+        if not living(foes):
+            return BattleOutcome(side, side_turns + 1, damage_dealt, species)
+        if not living(team):
+            return BattleOutcome(1 - side, side_turns + 1, damage_dealt, species)
+
+        turn_index[side] = (turn_index[side] + 1) % len(team)
+
+        if not has_press_turns(press_turns):
+            tick_buffs(foes)
+            side = 1 - side
+            press_turns = FRESH_PRESS_TURNS.copy()
+            side_turns += 1
+
+    return BattleOutcome(None, side_turns, damage_dealt, species)
+
+
+# ---------------------------------------------------------
+# Batches
+# ---------------------------------------------------------
+@dataclass
+class BatchStats:
+    battles: int = 0
+    wins: List[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    side_turns: int = 0
+    damage: Counter = field(default_factory=Counter)       # damage → hits
+    species: Dict[int, List[int]] = field(default_factory=dict)   # no → [battles, wins]
+
+    def add(self, outcome):
+        self.battles += 1
+        self.side_turns += outcome.side_turns
+        self.damage.update(outcome.damage)
+        if outcome.winner is None:
+            self.draws += 1
+        else:
+            self.wins[outcome.winner] += 1
+
+        for side, team in enumerate(outcome.species):
+            for no in team:
+                record = self.species.setdefault(no, [0, 0])
+                record[0] += 1
+                record[1] += (outcome.winner == side)
+
+    def merge(self, other):
+        self.battles += other.battles
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.draws += other.draws
+        self.side_turns += other.side_turns
+        self.damage.update(other.damage)
+        for no, (battles, wins) in other.species.items():
+            record = self.species.setdefault(no, [0, 0])
+            record[0] += battles
+            record[1] += wins
+
+    # ---------------------------------------------------------
+    # Report
+    # ---------------------------------------------------------
+    def win_rate(self, side):
+        return self.wins[side] / self.battles if self.battles else 0.0
+
+    def average_side_turns(self):
+        return self.side_turns / self.battles if self.battles else 0.0
+
+    def damage_percentiles(self, points=(50, 90, 99)):
+        """Return {point: damage} over every recorded hit."""
+        total = sum(self.damage.values())
+        result = {}
+        if not total:
+            return {p: 0 for p in points}
+
+        ordered = sorted(self.damage.items())
+        for p in points:
+            wanted = total * p / 100
+            seen = 0
+            for value, hits in ordered:
+                seen += hits
+                if seen >= wanted:
+                    result[p] = value
+                    break
+        return result
+
+    def summary_lines(self, min_battles=20, top=5):
+        hits = sum(self.damage.values())
+        mean = sum(v * n for v, n in self.damage.items()) / hits if hits else 0.0
+        pct = self.damage_percentiles()
+
+        lines = [
+            f"battles      {self.battles}",
+            f"player wins  {self.win_rate(SIDE_PLAYER):6.1%}",
+            f"enemy wins   {self.win_rate(SIDE_ENEMY):6.1%}",
+            f"draws        {self.draws / self.battles if self.battles else 0.0:6.1%}",
+            f"avg turns    {self.average_side_turns():6.2f}",
+            f"damage       mean {mean:.1f}  p50 {pct[50]}  p90 {pct[90]}  p99 {pct[99]}"
+            f"  max {max(self.damage, default=0)}",
+        ]
+
+        ranked = sorted(
+            ((wins / battles, no) for no, (battles, wins) in self.species.items()
+             if battles >= min_battles),
+            reverse=True
+        )
+        if ranked:
+            table = get_game_data().species
+            name = lambda no: table.get_by_number(no).name
+            lines.append("best species   " + ", ".join(f"{name(no)} {rate:.0%}" for rate, no in ranked[:top]))
+            lines.append("worst species  " + ", ".join(f"{name(no)} {rate:.0%}" for rate, no in ranked[-top:]))
+        return lines
+
+
+def random_team(rng, size):
+    entries = get_game_data().species
+    return [rng.choice(entries).no for _ in range(size)]
+
+
+def battle_seed(seed, index):
+    """Seed for battle `index` of a run, independent of how it is chunked."""
+    return seed * 1_000_003 + index
+
+
+def run_chunk(args):
+    """Worker entry point: play battles [start, start + count) of a run."""
+    seed, start, count, team_size, enemy_ai = args
+    policies = (random_action, random_action)
+    if enemy_ai:
+        # Fixed depth, no clock: results must not depend on machine speed
+        ai = EnemyAI(get_game_data().moves, time_budget=None, max_depth=AI_SIM_DEPTH)
+        policies = (random_action, ai.choose_action)
+
+    stats = BatchStats()
+    for index in range(start, start + count):
+        rng = random.Random(battle_seed(seed, index))
+        outcome = simulate_battle(random_team(rng, team_size),
+                                  random_team(rng, team_size),
+                                  rng, policies)
+        stats.add(outcome)
+    return stats
+
+
+def run_simulations(battles, seed=0, processes=None, team_size=4, chunk_size=250,
+                    enemy_ai=False):
+    """
+    Play `battles` seeded random-team battles over a process pool
+    (processes=1 runs in this process). The player side picks at random;
+    the enemy side too, or with EnemyAI if enemy_ai. Returns the merged
+    BatchStats; the result depends only on the arguments, not on chunking.
+    """
+    chunks = [
+        (seed, start, min(chunk_size, battles - start), team_size, enemy_ai)
+        for start in range(0, battles, chunk_size)
+    ]
+
+    total = BatchStats()
+    if processes == 1:
+        for chunk in chunks:
+            total.merge(run_chunk(chunk))
+        return total
+
+    with multiprocessing.Pool(processes) as pool:
+        for stats in pool.imap_unordered(run_chunk, chunks):
+            total.merge(stats)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo press-turn battles.")
+    parser.add_argument("--battles", type=int, default=10000,
+                        help="battles to play (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="run seed (default: 0)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--team-size", type=int, default=4,
+                        help="Pokémon per side (default: 4)")
+    parser.add_argument("--enemy-ai", action="store_true",
+                        help="enemy side uses the lookahead AI instead of random picks")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = run_simulations(args.battles, args.seed, args.processes, args.team_size,
+                            enemy_ai=args.enemy_ai)
+    seconds = time.perf_counter() - start
+
+    for line in stats.summary_lines():
+        print(line)
+    print(f"{seconds:.2f}s  ({stats.battles / seconds * 60:,.0f} battles/min)")
+
+
+if __name__ == "__main__":
+    main()
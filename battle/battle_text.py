@@ -0,0 +1,109 @@
+import pygame
+
+DIALOGUE_LINES = 3
+DIALOGUE_LINE_WIDTH = 32   # characters
+
+
+def wrap_text_words(text, max_width=DIALOGUE_LINE_WIDTH):
+    """
+    Word-wrap text into exactly DIALOGUE_LINES lists of words.
+    Explicit newlines force a new line; anything past the last line
+    is dropped.
+    """
+    lines = []
+    current = []
+
+    def flush_line():
+        nonlocal current, lines
+        if current:
+            lines.append(current)
+            current = []
+
+    # First, respect explicit newlines
+    segments = text.split("\n")
+
+    for si, segment in enumerate(segments):
+        words = segment.split()
+
+        for word in words:
+            predicted = " ".join(current + [word])
+            if len(predicted) > max_width:
+                flush_line()
+                if len(lines) == DIALOGUE_LINES:
+                    return _pad_lines(lines)
+                current = [word]
+            else:
+                current.append(word)
+
+        # After each segment except the last, force a new line
+        if si < len(segments) - 1:
+            flush_line()
+            if len(lines) == DIALOGUE_LINES:
+                return _pad_lines(lines)
+
+    # Flush any remaining words
+    flush_line()
+    return _pad_lines(lines)
+
+
+def _pad_lines(lines):
+    # Ensure exactly DIALOGUE_LINES lines
+    while len(lines) < DIALOGUE_LINES:
+        lines.append([])
+    return lines[:DIALOGUE_LINES]
+
+
+class TextLayout:
+    """
+    Dialogue text laid out once, when it is set, for the scroller.
+
+        lines    the wrapped line strings ("word word ... ")
+        starts   scroll index at which each line starts revealing
+
+    Glyph i of a line sits at i * font.spacing, so revealing the first
+    n characters of a line is a blit of its pre-rendered surface clipped
+    to n * font.spacing. Surfaces are rendered on the first draw, so
+    building a layout does not need a display.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.lines = []
+        self.starts = []
+
+        start = 0
+        for words in wrap_text_words(text):
+            line = " ".join(words) + " " if words else ""
+            self.lines.append(line)
+            self.starts.append(start)
+            start += len(line)
+
+        self.font = None
+        self.surfaces = None
+
+    def visible_chars(self, line_idx, scroll_index):
+        """How many characters of a line are shown at scroll_index."""
+        shown = int(scroll_index) - self.starts[line_idx]
+        return max(0, min(len(self.lines[line_idx]), shown))
+
+    def draw(self, screen, font, x, ys, scroll_index=None):
+        """
+        Draw each line at (x, ys[i]); scroll_index=None draws all of it.
+        """
+        if self.font is not font:
+            self.font = font
+            self.surfaces = [font.render_text(line) if line else None
+                             for line in self.lines]
+
+        for line_idx, surface in enumerate(self.surfaces):
+            if surface is None:
+                continue
+
+            if scroll_index is None:
+                screen.blit(surface, (x, ys[line_idx]))
+                continue
+
+            shown = self.visible_chars(line_idx, scroll_index)
+            if shown:
+                area = pygame.Rect(0, 0, shown * font.spacing, surface.get_height())
+                screen.blit(surface, (x, ys[line_idx]), area)
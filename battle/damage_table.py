@@ -0,0 +1,253 @@
+# battle/damage_table.py
+#
+# Vectorised battle_damage: expected outcomes for every
+# attacker × move × defender triple, evaluated with NumPy in one pass.
+#
+# The formula is the one in battle_damage (same constants, same order of
+# operations), so each cell equals what the scalar helpers give for that
+# triple. Intended for enemy AI and balance tooling.
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from constants import ELEMENT_INDEX
+from battle.battle_constants import *
+
+# The 85-100% damage roll, exactly as randint(85, 100) / 100
+DAMAGE_ROLLS = np.arange(85, 101) / 100
+
+# Press-turn cost in icons (see MatchupTable.turn_cost)
+TURN_COST_FULL = 1.0
+TURN_COST_HALF = 0.5
+TURN_COST_WIPE = float(len(FRESH_PRESS_TURNS))
+
+
+@dataclass(frozen=True)
+class MatchupTable:
+    """
+    Arrays indexed [attacker, move, defender].
+        hit_chance       probability the move connects
+        crit_chance      probability of a critical, given a hit
+        expected_damage  mean HP taken (misses count as 0), to the
+                         defender or, where reflected, to the attacker
+        plain_damage     mean HP taken given a hit that is not critical
+        crit_damage      mean HP taken given a critical hit
+        reflected        the defender reflects this move
+        turn_cost        expected press-turn icons consumed; a half turn
+                         is 0.5 and a wipe is the whole FRESH_PRESS_TURNS
+    """
+    move_names: Tuple[str, ...]
+    hit_chance: np.ndarray
+    crit_chance: np.ndarray
+    expected_damage: np.ndarray
+    plain_damage: np.ndarray
+    crit_damage: np.ndarray
+    reflected: np.ndarray
+    turn_cost: np.ndarray
+
+
+# Per-combatant columns, in row order (then affinities, then potential)
+_COMBATANT_COLUMNS = ("level", "attack", "defense", "spattack", "spdefense", "speed",
+                      "attack_buff", "defense_buff", "speed_buff", "is_guarding")
+
+
+def _combatant_arrays(combatants):
+    """Column arrays for the battle attributes of a list of Pokémon."""
+    n_elements = len(ELEMENT_INDEX)
+    n_columns = len(_COMBATANT_COLUMNS)
+
+    # One row per combatant, converted to NumPy in a single call
+    rows = np.array([
+        (c.level, c.attack, c.defense, c.spattack, c.spdefense, c.speed,
+         DMG_BUFFS[c.attack_buff], DMG_BUFFS[c.defense_buff],
+         DMG_BUFFS_ACC[c.speed_buff], c.is_guarding,
+         *c.affinities[:n_elements], *c.potential[:n_elements])
+        for c in combatants
+    ], dtype=float).reshape(len(combatants), n_columns + 2 * n_elements)
+
+    arrays = {name: rows[:, i] for i, name in enumerate(_COMBATANT_COLUMNS)}
+    arrays["is_guarding"] = arrays["is_guarding"] != 0
+    arrays["affinities"] = rows[:, n_columns:n_columns + n_elements]
+    arrays["potential"] = rows[:, n_columns + n_elements:]
+    return arrays
+
+
+# (id(moves), move_names) → (moves, arrays); see _move_arrays
+_move_array_cache = OrderedDict()
+_MOVE_ARRAY_CACHE_SIZE = 32
+
+
+def _move_arrays(move_names, moves):
+    """
+    Per-move columns, shaped (1, M, 1) except element. Cached per move
+    list, since callers (the enemy AI) keep asking for the same few.
+    """
+    key = (id(moves), move_names)
+    cached = _move_array_cache.get(key)
+    if cached is not None and cached[0] is moves:
+        _move_array_cache.move_to_end(key)
+        return cached[1]
+
+    entries = [moves[name] for name in move_names]
+    for name, move in zip(move_names, entries):
+        if move["element"] not in ELEMENT_INDEX:
+            raise ValueError(f"Move {name!r} has no affinity element")
+
+    arrays = {
+        "element": np.array([ELEMENT_INDEX[m["element"]] for m in entries], dtype=int),
+        "power": np.array([m["power"] for m in entries], dtype=float)[None, :, None],
+        "accuracy": np.array([m["accuracy"] for m in entries], dtype=float)[None, :, None],
+        "physical": np.array([m["type"] == "Physical" for m in entries])[None, :, None],
+        "special": np.array([m["type"] == "Special" for m in entries])[None, :, None],
+        "crit_chance": np.array([CHANCE_CRIT if m["element"] == "Physical" else 0.0
+                                 for m in entries], dtype=float)[None, :, None],
+    }
+
+    _move_array_cache[key] = (moves, arrays)
+    while len(_move_array_cache) > _MOVE_ARRAY_CACHE_SIZE:
+        _move_array_cache.popitem(last=False)
+    return arrays
+
+
+def _base_damage(user, target, power, physical, special):
+    """battle_damage.base_damage over broadcast arrays, up to the crit."""
+    damage = np.where(physical, power * user["attack"] / target["defense"],
+             np.where(special, power * user["spattack"] / target["spdefense"],
+                      power))
+    damage = damage * user["attack_buff"]
+    damage = damage / target["defense_buff"]
+    # level
+    damage = damage * (((2 * user["level"]) / 5) + 2)
+    damage = damage / 50
+    return damage + 2
+
+
+def _finish_damage(damage, target_affinity, target_guarding, user_potential):
+    """The rest of battle_damage.base_damage: affinities and potential."""
+    damage = np.where((target_affinity < AFFINITY_NEUTRAL) & ~target_guarding,
+                      damage * DMG_WEAK, damage)
+    damage = np.where((AFFINITY_RESIST <= target_affinity) & (target_affinity < AFFINITY_NULL),
+                      damage * DMG_RESIST, damage)
+    damage = np.where((AFFINITY_NULL <= target_affinity) & (target_affinity < AFFINITY_REFLECT),
+                      damage * DMG_IMMUNE, damage)
+    # potentials
+    return damage * (1.0 + (user_potential / 18))
+
+
+# Above this many cells, _mean_rolled goes roll by roll instead of
+# building a 16x temporary
+_ROLL_AT_ONCE_CELLS = 1 << 16
+
+
+def _mean_rolled(damage):
+    """
+    Mean of int(damage * roll) over the 16 equally likely rolls. The
+    truncated values are whole numbers, so the sum is exact in any order.
+    """
+    if damage.size <= _ROLL_AT_ONCE_CELLS:
+        return np.trunc(damage[..., None] * DAMAGE_ROLLS).sum(axis=-1) / len(DAMAGE_ROLLS)
+
+    total = np.zeros(damage.shape)
+    for roll in DAMAGE_ROLLS:
+        total += np.trunc(damage * roll)
+    return total / len(DAMAGE_ROLLS)
+
+
+def _hit_turn_cost(defender_affinity, is_crit, defender_guarding):
+    """battle_damage.hit_press_turn_cost, in icons."""
+    is_crit = np.asarray(is_crit)
+    weak = (is_crit | (defender_affinity < AFFINITY_NEUTRAL)) & ~defender_guarding
+    neutral = (AFFINITY_NEUTRAL <= defender_affinity) & (defender_affinity < AFFINITY_NULL) & ~is_crit
+    null = defender_affinity >= AFFINITY_NULL
+    return (weak * TURN_COST_HALF) + (neutral * TURN_COST_FULL) + (null * TURN_COST_WIPE)
+
+
+def _full(array, shape):
+    """array at the table shape, read-only (a broadcast view if smaller)."""
+    if array.shape == shape:
+        array.flags.writeable = False
+        return array
+    return np.broadcast_to(array, shape)
+
+
+def build_matchup_table(attackers, move_names, defenders, moves):
+    """
+    Evaluate every attacker × move × defender triple.
+    moves is the name → entry table; every named move must pass
+    battle_damage.is_damage_move().
+    """
+    move_names = tuple(move_names)
+    m = _move_arrays(move_names, moves)
+    element = m["element"]
+    power = m["power"]
+    accuracy = m["accuracy"]
+    physical = m["physical"]
+    special = m["special"]
+    crit_chance = m["crit_chance"]
+
+    a = _combatant_arrays(attackers)
+    d = _combatant_arrays(defenders)
+
+    # Shapes: attacker (A, 1, 1), move (1, M, 1), defender (1, 1, D)
+    A = {k: v[:, None, None] for k, v in a.items() if v.ndim == 1}
+    D = {k: v[None, None, :] for k, v in d.items() if v.ndim == 1}
+
+    defender_affinity = d["affinities"][:, element].T[None, :, :]     # (1, M, D)
+    attacker_affinity = a["affinities"][:, element][:, :, None]       # (A, M, 1)
+    attacker_potential = a["potential"][:, element][:, :, None]
+    defender_potential = d["potential"][:, element].T[None, :, :]
+
+    # Hit chance
+    odds_hit = accuracy / 100
+    odds_hit = odds_hit * A["speed_buff"]
+    odds_hit = odds_hit / D["speed_buff"]
+    atk_norm = (A["speed"] - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
+    def_norm = (D["speed"] - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
+    odds_hit = odds_hit * (1 + (DMG_SPEED_CONSTANT * (atk_norm - def_norm)))
+    odds_hit = np.clip(odds_hit, 0.0, 1.0)
+    hit_chance = np.where(defender_affinity >= AFFINITY_NULL, 1.0, odds_hit)
+
+    # Damage. Where the defender reflects, it hits the attacker instead,
+    # so pick user/target columns per cell before running the formula.
+    reflected = (AFFINITY_REFLECT <= defender_affinity) & (defender_affinity < AFFINITY_ABSORB)
+    if reflected.any():
+        user = {k: np.where(reflected, D[k], A[k])
+                for k in ("level", "attack", "spattack", "attack_buff")}
+        target = {k: np.where(reflected, A[k], D[k])
+                  for k in ("defense", "spdefense", "defense_buff", "is_guarding")}
+        target_affinity = np.where(reflected, np.minimum(AFFINITY_NULL, attacker_affinity),
+                                   defender_affinity)
+        user_potential = np.where(reflected, defender_potential, attacker_potential)
+    else:
+        # Usual case: nothing reflects, the columns broadcast as they are
+        user, target = A, D
+        target_affinity = defender_affinity
+        user_potential = attacker_potential
+
+    damage = _base_damage(user, target, power, physical, special)
+    plain = _mean_rolled(_finish_damage(damage, target_affinity,
+                                        target["is_guarding"], user_potential))
+    crit = _mean_rolled(_finish_damage(damage * DMG_CRIT, target_affinity,
+                                       target["is_guarding"], user_potential))
+    expected_hit = crit_chance * crit + (1.0 - crit_chance) * plain
+
+    # Press turns: a miss is two full turns
+    guarding = D["is_guarding"]
+    hit_cost = (crit_chance * _hit_turn_cost(defender_affinity, True, guarding) +
+                (1.0 - crit_chance) * _hit_turn_cost(defender_affinity, False, guarding))
+    turn_cost = hit_chance * hit_cost + (1.0 - hit_chance) * (2 * TURN_COST_FULL)
+
+    shape = (len(attackers), len(move_names), len(defenders))
+    return MatchupTable(
+        move_names=move_names,
+        hit_chance=_full(hit_chance, shape),
+        crit_chance=_full(crit_chance, shape),
+        expected_damage=_full(hit_chance * expected_hit, shape),
+        plain_damage=_full(plain, shape),
+        crit_damage=_full(crit, shape),
+        reflected=_full(reflected, shape),
+        turn_cost=_full(turn_cost, shape)
+    )
@@ -20,6 +20,22 @@ TARGET_FPS = 30
 
 SCROLL_SPEED = 5
 
+# Overworld asset cache budgets (bytes)
+TILESET_CACHE_BUDGET = 64 * 1024 * 1024
+MAP_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Scaled tiles kept per tileset, so a single large sheet (the route
+# tileset is ~100 MB fully built) fits in TILESET_CACHE_BUDGET
+TILESET_TILE_BUDGET = 32 * 1024 * 1024
+
+# Start loading a warp's destination once the player is this close (pixels)
+WARP_PRELOAD_DISTANCE = 3 * ACTUAL_TILE_SIZE
+
+# Map rendering is baked into square chunks of this many tiles per side,
+# kept up to this many bytes across all maps (well over one screenful)
+MAP_CHUNK_TILES = 16
+MAP_CHUNK_CACHE_BUDGET = 64 * 1024 * 1024
+
 ELEMENT_INDEX = {
     "Physical": 0,
     "Fire": 1,
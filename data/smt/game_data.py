@@ -0,0 +1,94 @@
+# data/smt/game_data.py
+
+import os
+from types import MappingProxyType
+
+from data.smt.smt_stats import load_pkmn_from_json, Species, SpeciesTable
+from data.smt.smt_moves import load_moves
+from data.smt.smt_items import load_items
+
+
+BASE_DIR = os.path.dirname(__file__)
+STATS_PATH = os.path.join(BASE_DIR, "smt_stats.json")
+MOVES_PATH = os.path.join(BASE_DIR, "smt_moves.json")
+ITEMS_PATH = os.path.join(BASE_DIR, "smt_items.json")
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class GameData:
+    """
+    Parsed SMT datasets (species, moves, items), loaded once and shared.
+
+    Everything here is read-only: species are frozen Species records,
+    move and item entries are frozen mappings with tuples for lists.
+    Callers that need to reorder species (e.g. the Pokédex sorts) take
+    their own list copy.
+
+    Indexed views:
+        species             SpeciesTable: O(1) lookup by dex number or name
+        moves_by_element    element → tuple of move names
+        moves_by_target     target ("Single", "All", ...) → tuple of move names
+    """
+
+    def __init__(self, stats_path=STATS_PATH, moves_path=MOVES_PATH, items_path=ITEMS_PATH):
+        # Species, in file order
+        self.species = SpeciesTable(
+            Species.from_dict(entry) for entry in load_pkmn_from_json(stats_path)
+        )
+
+        # Moves, name → entry
+        self.moves = _freeze(load_moves(moves_path))
+
+        by_element = {}
+        by_target = {}
+        for name, move in self.moves.items():
+            by_element.setdefault(move["element"], []).append(name)
+            by_target.setdefault(move["target"], []).append(name)
+        self.moves_by_element = _freeze(by_element)
+        self.moves_by_target = _freeze(by_target)
+
+        # Items, name → entry
+        self.items = _freeze(load_items(items_path))
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+    def get_species(self, pokedex_number):
+        return self.species.get_by_number(pokedex_number)
+
+    def get_species_by_name(self, name):
+        return self.species.get_by_name(name)
+
+    def moves_matching(self, element=None, target=None):
+        """
+        Return the names of moves with the given element and/or target,
+        in file order.
+        """
+        if element is None and target is None:
+            return tuple(self.moves.keys())
+        if target is None:
+            return self.moves_by_element.get(element, ())
+        if element is None:
+            return self.moves_by_target.get(target, ())
+
+        with_target = set(self.moves_by_target.get(target, ()))
+        return tuple(n for n in self.moves_by_element.get(element, ()) if n in with_target)
+
+
+_game_data = None
+
+
+def get_game_data():
+    """Return the shared GameData, parsing the JSON files on first use."""
+    global _game_data
+    if _game_data is None:
+        _game_data = GameData()
+    return _game_data
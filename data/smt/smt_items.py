@@ -5,5 +5,16 @@ import os
 BASE_DIR = os.path.dirname(__file__)
 ITEMS_PATH = os.path.join(BASE_DIR, "smt_items.json")
 
-with open(ITEMS_PATH, "r") as f:
-    SMT_ITEMS = json.load(f)
+
+def load_items(path=ITEMS_PATH):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def __getattr__(name):
+    # SMT_ITEMS used to be parsed at import time; it now comes from the
+    # shared GameData so the file is only read once, on first use.
+    if name == "SMT_ITEMS":
+        from data.smt.game_data import get_game_data
+        return get_game_data().items
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,10 @@
 # data/smt/smt_stats.py
 
 import json
+from array import array
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 
 from pokedex.pokemon import Pokemon
 
@@ -49,6 +51,77 @@ class SMTStats:
         }
 
 
+# ---------------------------------------------------------
+# Species record
+# ---------------------------------------------------------
+
+# Order of Species.stats, and the JSON key for each
+STAT_NAMES = ("hp", "atk", "def", "spatk", "spdef", "spd")
+STAT_JSON_KEYS = ("HP", "Atk", "Def", "SpAtk", "SpDef", "Spd")
+_STAT_INDEX = {name: i for i, name in enumerate(STAT_NAMES)}
+
+# Interned learnset move names; Species.learnset stores indices into this
+LEARNSET_MOVE_NAMES: List[str] = []
+_learnset_move_ids: Dict[str, int] = {}
+
+
+def _learnset_move_id(name: str) -> int:
+    move_id = _learnset_move_ids.get(name)
+    if move_id is None:
+        move_id = len(LEARNSET_MOVE_NAMES)
+        LEARNSET_MOVE_NAMES.append(name)
+        _learnset_move_ids[name] = move_id
+    return move_id
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Species:
+    """
+    Compact, read-only species entry. There is one per dex number, so
+    entries compare and hash by identity (the arrays are unhashable).
+        stats       (hp, atk, def, spatk, spdef, spd) base stats
+        affinities  array('b'), one per ELEMENT_INDEX element
+        potential   array('b'), one per POTENTIAL_ORDER entry
+        learnset    array('H') of packed (level, move_id) pairs
+    """
+    no: int
+    name: str
+    bst: int
+    level: int
+    stats: Tuple[int, int, int, int, int, int]
+    affinities: array
+    potential: array
+    learnset: array
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        learnset = array("H")
+        for m in data.get("learnset", []):
+            learnset.append(m["level"])
+            learnset.append(_learnset_move_id(m["move"]))
+
+        return cls(
+            no=data["no"],
+            name=data["name"],
+            bst=data["bst"],
+            level=data.get("level", 1),
+            stats=tuple(data["stats"][key] for key in STAT_JSON_KEYS),
+            affinities=array("b", data["affinities"]),
+            potential=array("b", data.get("potential") or [0] * 9),
+            learnset=learnset
+        )
+
+    def stat(self, name: str) -> int:
+        """Base stat by name ("hp", "atk", "def", "spatk", "spdef", "spd")."""
+        return self.stats[_STAT_INDEX[name.lower()]]
+
+    def learnset_moves(self):
+        """Yield (level, move name) pairs in learn order."""
+        packed = self.learnset
+        for i in range(0, len(packed), 2):
+            yield packed[i], LEARNSET_MOVE_NAMES[packed[i + 1]]
+
+
 # ---------------------------------------------------------
 # Species Loader (NO Pokémon instances here)
 # ---------------------------------------------------------
@@ -67,40 +140,95 @@ def load_pkmn_from_json(path: str) -> List[Dict]:
 # Species lookup
 # ---------------------------------------------------------
 
-def get_species_by_number(species_list: List[Dict], pokedex_number: int) -> Optional[Dict]:
+class SpeciesTable(Sequence):
+    """
+    Read-only species list with constant-time lookups.
+    Iterates/indexes like the list it was built from, plus:
+        - a dense array indexed by Pokédex number
+        - a lowercase name → entry hash
+    """
+
+    def __init__(self, entries):
+        self.entries = tuple(entries)
+
+        size = max((s.no for s in self.entries), default=0) + 1
+        self.by_number = [None] * size
+        self.by_name = {}
+        for s in self.entries:
+            self.by_number[s.no] = s
+            self.by_name[s.name.lower()] = s
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_by_number(self, pokedex_number: int) -> Optional[Species]:
+        if 0 <= pokedex_number < len(self.by_number):
+            return self.by_number[pokedex_number]
+        return None
+
+    def get_by_name(self, name: str) -> Optional[Species]:
+        return self.by_name.get(name.lower())
+
+    def lookup(self, key: Union[int, str]) -> Optional[Species]:
+        """Find a species by Pokédex number or by name."""
+        if isinstance(key, str):
+            return self.get_by_name(key)
+        return self.get_by_number(key)
+
+
+def get_species_by_number(species_list, pokedex_number: int):
     """
-    Return the species dict matching the given Pokédex number.
+    Return the species matching the given Pokédex number.
+    O(1) for a SpeciesTable; plain lists (of Species or raw dicts)
+    fall back to a scan.
     """
-    return next((s for s in species_list if s["no"] == pokedex_number), None)
+    if isinstance(species_list, SpeciesTable):
+        return species_list.get_by_number(pokedex_number)
+    return next(
+        (s for s in species_list
+         if (s["no"] if isinstance(s, Mapping) else s.no) == pokedex_number),
+        None
+    )
 
 
 # ---------------------------------------------------------
 # Pokémon factory (creates UNIQUE Pokémon instances)
 # ---------------------------------------------------------
 
-def create_pokemon_from_species(entry: Dict, level: Optional[int] = None) -> Pokemon:
+def create_pokemon_from_species(entry: Union[Species, Dict, int, str], level: Optional[int] = None) -> Pokemon:
     """
     Create a fresh Pokémon instance from a species entry.
+    entry may also be a raw JSON dict, or a Pokédex number or species
+    name looked up in the shared GameData species table.
     This ensures no shared references between player/enemy teams.
     """
+    if isinstance(entry, Mapping):
+        entry = Species.from_dict(entry)
+    elif not isinstance(entry, Species):
+        from data.smt.game_data import get_game_data
+
+        key = entry
+        entry = get_game_data().species.lookup(key)
+        if entry is None:
+            raise ValueError(f"Unknown species: {key!r}")
+
     # Convert stats
-    raw_stats = SMTStats.from_dict(entry["stats"])
-    stats_dict = raw_stats.to_base_stat_dict()
+    stats_dict = SMTStats(*entry.stats).to_base_stat_dict()
 
     # Learnset
-    learnset = [Move(m["level"], m["move"]) for m in entry.get("learnset", [])]
-
-    # Potential (default 9 zeros)
-    potential = entry.get("potential") or [0] * 9
+    learnset = [Move(lvl, move) for lvl, move in entry.learnset_moves()]
 
     # Construct a NEW Pokémon instance
     return Pokemon(
-        pokedex_number=entry["no"],
-        name=entry["name"],
-        level=level or entry.get("level", 1),
+        pokedex_number=entry.no,
+        name=entry.name,
+        level=level or entry.level,
         stats=stats_dict,
-        affinities=entry["affinities"],
-        potential=potential,
+        affinities=list(entry.affinities),
+        potential=list(entry.potential),
         learnset=learnset,
-        bst=entry["bst"]
+        bst=entry.bst
     )
@@ -0,0 +1,121 @@
+import argparse
+import os
+import time
+
+# Must be set before pygame creates the display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from constants import *
+from main import create_state_manager
+
+
+class HeldKeys:
+    """Stand-in for pygame.key.get_pressed(): indexable by key constant."""
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class ScriptedInput:
+    """
+    Injectable input source for headless runs.
+
+    script is a list of steps:
+        (state_name, frames, held_keys, tap_keys, tap_every)
+    For `frames` frames the given keys are held down, and every
+    `tap_every` frames a KEYDOWN is sent for each key in tap_keys.
+    """
+
+    def __init__(self, script):
+        self.script = script
+        self.held = HeldKeys()
+
+    def get_pressed(self):
+        return self.held
+
+    def steps(self):
+        """Yield (state_name, frame_events) for every scripted frame."""
+        for state_name, frames, held_keys, tap_keys, tap_every in self.script:
+            self.held = HeldKeys(held_keys)
+            for frame in range(frames):
+                events = []
+                if tap_keys and tap_every and frame % tap_every == tap_every - 1:
+                    for key in tap_keys:
+                        events.append(pygame.event.Event(
+                            pygame.KEYDOWN, key=key, unicode="", mod=0
+                        ))
+                yield state_name, events
+
+
+def default_script(frames):
+    """Walk around the overworld, page the Pokédex, browse the battle menu."""
+    half = max(1, frames // 2)
+    return [
+        ("overworld", half, (pygame.K_RIGHT,), (), 0),
+        ("overworld", frames - half, (pygame.K_DOWN, pygame.K_LEFT), (), 0),
+        ("pokedex", frames, (), (pygame.K_RIGHT,), 5),
+        ("battle", frames, (), (pygame.K_RIGHT, pygame.K_DOWN), 10),
+    ]
+
+
+def run_headless(script, screen_width=ACTUAL_WIDTH, screen_height=ACTUAL_HEIGHT):
+    """
+    Run the full game loop with a dummy display and no frame cap.
+    Returns {state_name: (frames, seconds)} measured over update + draw.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((screen_width, screen_height))
+
+    scripted = ScriptedInput(script)
+    state_manager = create_state_manager(screen_width, screen_height,
+                                         key_source=scripted.get_pressed)
+
+    totals = {}
+    active = None
+
+    for state_name, events in scripted.steps():
+        if state_name != active:
+            state_manager.change(state_name)
+            active = state_name
+
+        start = time.perf_counter()
+
+        for event in events:
+            state_manager.handle_event(event)
+        state_manager.update()
+        dirty_rects = state_manager.draw(screen)
+
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+        frames, seconds = totals.get(state_name, (0, 0.0))
+        totals[state_name] = (frames + 1, seconds + time.perf_counter() - start)
+
+    state_manager.shutdown()
+    pygame.quit()
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless throughput run of the game loop.")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="frames to simulate per state (default: 600)")
+    args = parser.parse_args()
+
+    totals = run_headless(default_script(args.frames))
+
+    for state_name, (frames, seconds) in totals.items():
+        fps = frames / seconds if seconds > 0 else float("inf")
+        print(f"{state_name:<10} {frames:>6} frames  {seconds:8.3f}s  {fps:10.1f} fps")
+
+
+if __name__ == "__main__":
+    main()
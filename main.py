@@ -3,7 +3,7 @@ import pygame
 from constants import *
 
 # Overworld subsystem
-from overworld.map import Map
+from overworld.map import load_map
 from overworld.player import Player
 
 # Pokédex subsystem
@@ -17,66 +17,76 @@ from state.pokedex_state import PokedexState
 from state.battle_state import BattleState
 
 
-def main():
-    pygame.init()
-
-    # ---------------------------------------------------------
-    # Window setup
-    # ---------------------------------------------------------
-    screen_width = ACTUAL_WIDTH
-    screen_height = ACTUAL_HEIGHT
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("SMT Pokemon Game")
-
-    clock = pygame.time.Clock()
+def create_state_manager(screen_width, screen_height, key_source=None):
+    """
+    Register every game state with a new StateManager.
+    States are registered as factories and built on their first change(),
+    so nothing is loaded for a screen the player never opens.
+    key_source replaces pygame.key.get_pressed for the overworld.
+    """
 
     # ---------------------------------------------------------
     # Overworld setup
     # ---------------------------------------------------------
-    map_obj = Map("room0", screen_width, screen_height)
+    def create_overworld():
+        map_obj = load_map("room0", screen_width, screen_height)
 
-    player = Player(
-        x=5 * ACTUAL_TILE_SIZE,
-        y=5 * ACTUAL_TILE_SIZE
-    )
+        player = Player(
+            x=5 * ACTUAL_TILE_SIZE,
+            y=5 * ACTUAL_TILE_SIZE
+        )
+
+        debug_walls_enabled = False
 
-    debug_walls_enabled = False
+        return OverworldState(
+            map_obj,
+            player,
+            screen_width,
+            screen_height,
+            debug_walls_enabled,
+            key_source
+        )
 
     # ---------------------------------------------------------
     # Pokédex setup
     # ---------------------------------------------------------
-    pokedex_controller = PokemonController()
-    pokedex_view = PokemonView(pokedex_controller)
+    def create_pokedex():
+        pokedex_controller = PokemonController()
+        pokedex_view = PokemonView(pokedex_controller)
+
+        return PokedexState(
+            pokedex_controller,
+            pokedex_view
+        )
 
     # ---------------------------------------------------------
     # State Manager + State Registration
     # ---------------------------------------------------------
     state_manager = StateManager()
 
-    state_manager.register(
-        "overworld",
-        OverworldState(
-            map_obj,
-            player,
-            screen_width,
-            screen_height,
-            debug_walls_enabled
-        )
-    )
+    state_manager.register("overworld", create_overworld)
+    state_manager.register("pokedex", create_pokedex)
 
-    state_manager.register(
-        "pokedex",
-        PokedexState(
-            pokedex_controller,
-            pokedex_view
-        )
-    )
+    # BattleState is cheap to build; its data and assets load on enter()
+    state_manager.register("battle", BattleState)
 
-    state_manager.register(
-        "battle",
-        BattleState(
-        )
-    )
+    return state_manager
+
+
+def main():
+    pygame.init()
+
+    # ---------------------------------------------------------
+    # Window setup
+    # ---------------------------------------------------------
+    screen_width = ACTUAL_WIDTH
+    screen_height = ACTUAL_HEIGHT
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("SMT Pokemon Game")
+
+    clock = pygame.time.Clock()
+
+    state_manager = create_state_manager(screen_width, screen_height)
 
     # Start in overworld
     state_manager.change("overworld")
@@ -99,14 +109,18 @@ def main():
 
                 # Toggle Pokédex
                 if event.key == pygame.K_p:
-                    if state_manager.current is not state_manager.states["pokedex"]:
+                    if not state_manager.is_active("pokedex"):
                         state_manager.change("pokedex")
                     else:
                         state_manager.change("overworld")
 
+                # Toggle frame-time overlay
+                elif event.key == pygame.K_F3:
+                    state_manager.toggle_profiler_overlay()
+
                 # Toggle Battle
                 elif event.key == pygame.K_b:
-                    if state_manager.current is not state_manager.states["battle"]:
+                    if not state_manager.is_active("battle"):
                         state_manager.change("battle")
                     else:
                         state_manager.change("overworld")
@@ -118,11 +132,15 @@ def main():
         # Update + Draw
         # -----------------------------
         state_manager.update()
-        state_manager.draw(screen)
+        dirty_rects = state_manager.draw(screen)
 
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
         clock.tick(TARGET_FPS)
 
+    state_manager.shutdown()
     pygame.quit()
 
 
@@ -0,0 +1,106 @@
+# overworld/asset_cache.py
+
+import sys
+from collections import OrderedDict
+
+
+class AssetCache:
+    """
+    Bounded LRU registry for loaded assets (maps, tilesets, Pokédex panels).
+
+    Entries are keyed by any hashable key (e.g. (name, scale)) and sized
+    in bytes by the `sizeof` callable when they are inserted, and again
+    whenever resize() is called for one that has grown since. Whenever
+    the running total goes over `budget_bytes`, the least recently used
+    entries are evicted. The most recently used entry is always kept, even
+    if it alone is over budget.
+    """
+
+    def __init__(self, budget_bytes, sizeof):
+        self.budget_bytes = budget_bytes
+        self.sizeof = sizeof
+        self.entries = OrderedDict()   # key → asset, oldest first
+        self.sizes = {}                # key → bytes, measured on insert
+        self._bytes = 0
+
+    def get(self, key, loader):
+        """
+        Return the cached asset for key, calling loader() on a miss.
+        """
+        asset = self.entries.get(key)
+        if asset is not None:
+            self.entries.move_to_end(key)
+            return asset
+
+        asset = loader()
+        size = self.sizeof(asset)
+        self.entries[key] = asset
+        self.sizes[key] = size
+        self._bytes += size
+
+        self.evict()
+        return asset
+
+    def resize(self, key):
+        """
+        Re-measure an entry whose size changed after insert (e.g. a
+        Tileset building tiles), mark it used and evict to fit.
+        """
+        asset = self.entries.get(key)
+        if asset is None:
+            return
+
+        size = self.sizeof(asset)
+        self._bytes += size - self.sizes[key]
+        self.sizes[key] = size
+        self.entries.move_to_end(key)
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until within budget."""
+        while len(self.entries) > 1 and self._bytes > self.budget_bytes:
+            key, _ = self.entries.popitem(last=False)
+            self._bytes -= self.sizes.pop(key)
+
+    def total_bytes(self):
+        return self._bytes
+
+    def clear(self):
+        self.entries.clear()
+        self.sizes.clear()
+        self._bytes = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def surface_bytes(surface):
+    """Pixel memory of a pygame.Surface, for use as an AssetCache sizeof."""
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def container_bytes(*objects):
+    """
+    sys.getsizeof of objects and of everything inside them (list, tuple,
+    set and dict items, recursively), each object counted once. For
+    sizing plain-Python asset data such as a map's wall tables.
+    """
+    seen = set()
+    total = 0
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
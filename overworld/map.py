@@ -1,12 +1,60 @@
 import json
 import os
 import pygame
-from overworld.tileset import Tileset
-from constants import SCALE
+from array import array
+from overworld.tileset import get_shared_tileset
+from overworld.asset_cache import AssetCache, container_bytes, surface_bytes
+from overworld.regions import RegionIndex
+from overworld.map_format import compiled_path, read_compiled_map
+from constants import (SCALE, ACTUAL_TILE_SIZE, MAP_CACHE_BUDGET,
+                       MAP_CHUNK_TILES, MAP_CHUNK_CACHE_BUDGET)
+
+
+# Parsed maps, keyed by (name, scale) and bounded by MAP_CACHE_BUDGET
+_map_cache = AssetCache(MAP_CACHE_BUDGET, lambda m: m.memory_size())
+
+# Baked chunk surfaces of every map, keyed by (map name, scale, cx, cy)
+# and bounded by MAP_CHUNK_CACHE_BUDGET
+_chunk_cache = AssetCache(MAP_CHUNK_CACHE_BUDGET, surface_bytes)
+
+
+def load_map(name, screen_width, screen_height, data=None):
+    """
+    Return the Map for this room, reusing a cached instance if the
+    room has been loaded before. Used for warps so revisiting a room
+    does not touch the disk again. data may be pre-read map JSON.
+    """
+    return _map_cache.get(
+        (name, SCALE, screen_width, screen_height),
+        lambda: Map(name, screen_width, screen_height, data)
+    )
+
+
+def is_map_loaded(name, screen_width, screen_height):
+    return (name, SCALE, screen_width, screen_height) in _map_cache
+
+
+def read_map_data(name):
+    """
+    Load map data from disk (no pygame calls; thread-safe).
+    Uses the compiled .bin when it is at least as new as the JSON,
+    otherwise parses the JSON.
+    """
+    path = os.path.join("data", "maps", f"{name}.json")
+    bin_path = compiled_path(path)
+
+    if os.path.exists(bin_path) and (
+        not os.path.exists(path)
+        or os.path.getmtime(bin_path) >= os.path.getmtime(path)
+    ):
+        return read_compiled_map(bin_path)
+
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 class Map:
-    def __init__(self, name, screen_width, screen_height):
+    def __init__(self, name, screen_width, screen_height, data=None):
         """
         Pygame version of the Map class.
 
@@ -17,11 +65,14 @@ class Map:
         """
         self.name = name
 
-        data = self.load_map_data(name)
+        if data is None:
+            data = self.load_map_data(name)
 
         self.width = data["width"]
         self.height = data["height"]
-        self.tiles = data["tiles"]
+
+        # Flat row-major uint16 grid: tile (x, y) is tiles[y * width + x]
+        self.tiles = self.pack_tiles(data["tiles"])
 
         self.scrolling = data.get("scrolling", True)
 
@@ -31,6 +82,16 @@ class Map:
             scaled_walls.append((wx * SCALE, wy * SCALE, length * SCALE, orient))
         self.walls = scaled_walls
 
+        # Uniform grid over wall bounding boxes for collision queries
+        self.wall_cell_size = ACTUAL_TILE_SIZE
+        self.wall_grid = self.build_wall_grid()
+
+        # Diagonal orientations the "slide up" rule can use, in wall order
+        self.slide_orients = []
+        for wx, wy, length, orient in self.walls:
+            if orient in ("up_right", "up_left") and orient not in self.slide_orients:
+                self.slide_orients.append(orient)
+
         self.tileset = self.load_tileset(data["tileset"])
 
         self.warps = data.get("warps", [])
@@ -48,6 +109,25 @@ class Map:
             })
         self.warps = scaled_warps
 
+        # Other trigger regions (signs, encounter zones, NPC triggers, ...).
+        # Each entry has a "type" plus x/y/width/height in logical pixels.
+        scaled_triggers = []
+        for trigger in data.get("triggers", []):
+            scaled = dict(trigger)
+            for key in ("x", "y", "width", "height"):
+                scaled[key] = trigger[key] * SCALE
+            scaled_triggers.append(scaled)
+        self.triggers = scaled_triggers
+
+        # One spatial index over every warp and trigger region
+        self.regions = RegionIndex(ACTUAL_TILE_SIZE)
+        for warp in self.warps:
+            self.regions.add("warp", warp["x"], warp["y"],
+                             warp["width"], warp["height"], warp)
+        for trigger in self.triggers:
+            self.regions.add(trigger["type"], trigger["x"], trigger["y"],
+                             trigger["width"], trigger["height"], trigger)
+
         self.camera_x = 0
         self.camera_y = 0
 
@@ -62,18 +142,51 @@ class Map:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
+        # Pre-rendered N×N tile chunks live in the shared _chunk_cache.
+        # The tile grid is static, so a chunk is baked on first view and
+        # again only if it has been evicted since.
+        self.chunk_tiles = MAP_CHUNK_TILES
+
     # ---------------------------------------------------------
     # Loading
     # ---------------------------------------------------------
     def load_map_data(self, name):
         """Load JSON map data from disk."""
-        path = os.path.join("data", "maps", f"{name}.json")
-        with open(path, "r") as f:
-            return json.load(f)
+        return read_map_data(name)
+
+    def pack_tiles(self, tiles):
+        """
+        Return the tile grid as one flat array('H'). Accepts the JSON
+        list of rows or an already flat array from a compiled map.
+        """
+        if isinstance(tiles, array):
+            grid = tiles
+        else:
+            grid = array("H", (tile_id for row in tiles for tile_id in row))
+
+        if len(grid) != self.width * self.height:
+            raise ValueError(f"Map '{self.name}' tile grid does not match width × height.")
+        return grid
+
+    def tile_at(self, x, y):
+        """Return the tile id at tile coordinates (x, y)."""
+        return self.tiles[y * self.width + x]
 
     def load_tileset(self, tileset_name):
-        """Load the tileset used by this map."""
-        return Tileset(tileset_name)
+        """Load the tileset used by this map (shared with other maps)."""
+        return get_shared_tileset(tileset_name)
+
+    def memory_size(self):
+        """
+        Memory held by this map's own data (not the tileset, nor the
+        baked chunks, which _chunk_cache accounts for): the tile grid
+        array, the wall/warp/trigger tables and their grid indexes.
+        """
+        return container_bytes(
+            self.tiles,
+            self.walls, self.wall_grid, self.slide_orients,
+            self.warps, self.triggers, vars(self.regions)
+        )
 
     # ---------------------------------------------------------
     # Drawing
@@ -89,30 +202,59 @@ class Map:
 
     def redraw_visible_tiles(self, surface):
         """
-        Draw only the tiles that are visible within the current camera.
+        Draw the pre-rendered chunks that overlap the current camera.
         """
         tw = self.tileset.tile_width * self.tileset.scale
         th = self.tileset.tile_height * self.tileset.scale
 
-        canvas_w = self.screen_width
-        canvas_h = self.screen_height
+        chunk_w = self.chunk_tiles * tw
+        chunk_h = self.chunk_tiles * th
+
+        chunks_x = -(-self.width // self.chunk_tiles)
+        chunks_y = -(-self.height // self.chunk_tiles)
+
+        # Visible chunk range
+        start_x = int(max(0, self.camera_x // chunk_w))
+        start_y = int(max(0, self.camera_y // chunk_h))
+
+        end_x = int(min(chunks_x, (self.camera_x + self.screen_width) // chunk_w + 1))
+        end_y = int(min(chunks_y, (self.camera_y + self.screen_height) // chunk_h + 1))
+
+        for cy in range(start_y, end_y):
+            for cx in range(start_x, end_x):
+                px = cx * chunk_w - self.camera_x
+                py = cy * chunk_h - self.camera_y
+
+                surface.blit(self.get_chunk(cx, cy), (px, py))
+
+    def get_chunk(self, cx, cy):
+        """Return the baked surface for chunk (cx, cy), rendering it on a miss."""
+        return _chunk_cache.get((self.name, SCALE, cx, cy),
+                                lambda: self.render_chunk(cx, cy))
+
+    def render_chunk(self, cx, cy):
+        """Blit the tiles of one N×N chunk into a new opaque surface."""
+        tw = self.tileset.tile_width * self.tileset.scale
+        th = self.tileset.tile_height * self.tileset.scale
 
-        # Visible tile range
-        start_x = int(max(0, self.camera_x // tw))
-        start_y = int(max(0, self.camera_y // th))
+        start_x = cx * self.chunk_tiles
+        start_y = cy * self.chunk_tiles
+        end_x = min(self.width, start_x + self.chunk_tiles)
+        end_y = min(self.height, start_y + self.chunk_tiles)
 
-        end_x = int(min(self.width, (self.camera_x + canvas_w) // tw + 2))
-        end_y = int(min(self.height, (self.camera_y + canvas_h) // th + 2))
+        # Same black backdrop the overworld clears the screen to
+        chunk = pygame.Surface(((end_x - start_x) * tw, (end_y - start_y) * th)).convert()
+        chunk.fill((0, 0, 0))
 
         for y in range(start_y, end_y):
+            row = y * self.width
             for x in range(start_x, end_x):
-                tile_id = self.tiles[y][x]
+                tile_id = self.tiles[row + x]
                 img = self.tileset.get(tile_id)  # pygame.Surface
 
-                px = x * tw - self.camera_x
-                py = y * th - self.camera_y
+                chunk.blit(img, ((x - start_x) * tw, (y - start_y) * th))
 
-                surface.blit(img, (px, py))
+        return chunk
 
     def draw_debug_walls(self, surface):
         """Draw debug wall overlays onto the given surface."""
@@ -163,6 +305,40 @@ class Map:
             pygame.draw.line(surface, color, (x4, y4), (x1, y1), width=2)
 
 
+    # ---------------------------------------------------------
+    # Wall Index
+    # ---------------------------------------------------------
+    def build_wall_grid(self):
+        """
+        Bucket every wall index into each grid cell its bounding box touches.
+        Returns a dict: (cell_x, cell_y) → [wall indices].
+        """
+        cell = self.wall_cell_size
+        grid = {}
+
+        for i, (wx, wy, length, orient) in enumerate(self.walls):
+            x1, y1, x2, y2 = self.compute_wall_endpoints(wx, wy, length, orient)
+
+            for cy in range(int(min(y1, y2) // cell), int(max(y1, y2) // cell) + 1):
+                for cx in range(int(min(x1, x2) // cell), int(max(x1, x2) // cell) + 1):
+                    grid.setdefault((cx, cy), []).append(i)
+
+        return grid
+
+    def walls_near(self, left, top, right, bottom):
+        """
+        Return the walls whose bounding boxes share a grid cell with the
+        given box, in their original map order.
+        """
+        cell = self.wall_cell_size
+        found = set()
+
+        for cy in range(int(top // cell), int(bottom // cell) + 1):
+            for cx in range(int(left // cell), int(right // cell) + 1):
+                found.update(self.wall_grid.get((cx, cy), ()))
+
+        return [self.walls[i] for i in sorted(found)]
+
     # ---------------------------------------------------------
     # Collision
     # ---------------------------------------------------------
@@ -181,7 +357,17 @@ class Map:
         new_left,  new_right  = new_x, new_x + w
         new_top,   new_bottom = new_y, new_y + h
 
-        for wx, wy, length, orient in self.walls:
+        # Only walls near the swept box can collide. The box is padded by
+        # the diagonal test's reach (half the player's larger side).
+        pad = max(w, h) / 2
+        candidates = self.walls_near(
+            min(old_left, new_left) - pad,
+            min(old_top, new_top) - pad,
+            max(old_right, new_right) + pad,
+            max(old_bottom, new_bottom) + pad
+        )
+
+        for wx, wy, length, orient in candidates:
 
             # -----------------------------------------------------
             # Horizontal wall (blocks vertical movement)
@@ -261,21 +447,18 @@ class Map:
 
         return False
     
+    def check_regions(self, x, y, w, h, kind=None):
+        """
+        Return every (kind, region dict) whose area overlaps (x, y, w, h).
+        Pass kind (e.g. "warp") to filter by region type.
+        """
+        return self.regions.query(x, y, w, h, kind)
+
     def check_warp(self, x, y, w, h):
         """Return warp dict if (x, y, w, h) overlaps a warp region, else None."""
-        left, right = x, x + w
-        top, bottom = y, y + h
-
-        for warp in self.warps:
-            wx, wy = warp["x"], warp["y"]
-            ww, wh = warp["width"], warp["height"]
-
-            w_left, w_right = wx, wx + ww
-            w_top, w_bottom = wy, wy + wh
-
-            if not (right <= w_left or left >= w_right or
-                    bottom <= w_top or top >= w_bottom):
-                return warp
+        hits = self.regions.query(x, y, w, h, "warp")
+        if hits:
+            return hits[0][1]
 
         return None
 
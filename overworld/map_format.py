@@ -0,0 +1,194 @@
+# overworld/map_format.py
+#
+# Compact binary map format ("compiled" maps).
+#
+# Run `python -m overworld.map_format` from the project root to compile
+# every data/maps/*.json into a .bin next to it. read_map_data() in
+# overworld/map.py prefers an up-to-date .bin and falls back to JSON.
+#
+# Layout (little-endian):
+#   header   magic "SMTM", version u16, width u16, height u16, flags u16
+#   tileset  u16 length + utf-8 name
+#   tiles    width * height × u16, row-major
+#   walls    u16 count, then per wall: x i32, y i32, length i32, orient u8
+#   warps    u16 count, then per warp: x, y, width, height,
+#            dest_x, dest_y i32, facing u8, u16 length + utf-8 to_room
+#   extra    u32 length + utf-8 JSON of any other keys (e.g. "triggers")
+
+import glob
+import json
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"SMTM"
+VERSION = 1
+
+FLAG_SCROLLING = 1
+
+WALL_ORIENTS = ["h", "v", "up_right", "up_left", "down_left", "down_right"]
+FACINGS = ["down", "up", "left", "right"]
+NO_FACING = 255
+
+HEADER = struct.Struct("<4sHHHH")
+WALL = struct.Struct("<iiiB")
+WARP = struct.Struct("<iiiiiiB")
+COUNT = struct.Struct("<H")
+EXTRA_LEN = struct.Struct("<I")
+
+# Keys stored in the fixed sections; everything else goes in "extra"
+_FIXED_KEYS = {"tileset", "width", "height", "scrolling", "tiles", "walls", "warps"}
+
+
+def compiled_path(json_path):
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+# ---------------------------------------------------------
+# Writing
+# ---------------------------------------------------------
+def _pack_str(text):
+    raw = text.encode("utf-8")
+    return COUNT.pack(len(raw)) + raw
+
+
+def compile_map(data):
+    """Encode a parsed map JSON dict into the binary format."""
+    width = data["width"]
+    height = data["height"]
+    flags = FLAG_SCROLLING if data.get("scrolling", True) else 0
+
+    out = [HEADER.pack(MAGIC, VERSION, width, height, flags)]
+    out.append(_pack_str(data["tileset"]))
+
+    tiles = array("H", (tile for row in data["tiles"] for tile in row))
+    if len(tiles) != width * height:
+        raise ValueError("tile grid does not match width × height")
+    if sys.byteorder == "big":
+        tiles.byteswap()
+    out.append(tiles.tobytes())
+
+    walls = data.get("walls", [])
+    out.append(COUNT.pack(len(walls)))
+    for wx, wy, length, orient in walls:
+        out.append(WALL.pack(wx, wy, length, WALL_ORIENTS.index(orient)))
+
+    warps = data.get("warps", [])
+    out.append(COUNT.pack(len(warps)))
+    for warp in warps:
+        facing = warp.get("dest_facing")
+        out.append(WARP.pack(
+            warp["x"], warp["y"], warp["width"], warp["height"],
+            warp["dest_x"], warp["dest_y"],
+            NO_FACING if facing is None else FACINGS.index(facing)
+        ))
+        out.append(_pack_str(warp["to_room"]))
+
+    extra = {k: v for k, v in data.items() if k not in _FIXED_KEYS}
+    raw = json.dumps(extra).encode("utf-8") if extra else b""
+    out.append(EXTRA_LEN.pack(len(raw)) + raw)
+
+    return b"".join(out)
+
+
+# ---------------------------------------------------------
+# Reading
+# ---------------------------------------------------------
+def decode_map(buf):
+    """
+    Decode the binary format into the same dict shape as the JSON,
+    except "tiles" is the flat row-major array('H') Map stores directly.
+    """
+    view = memoryview(buf)
+
+    magic, version, width, height, flags = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a compiled map (or wrong version)")
+    pos = HEADER.size
+
+    def read_str():
+        nonlocal pos
+        (n,) = COUNT.unpack_from(view, pos)
+        pos += COUNT.size
+        text = bytes(view[pos:pos + n]).decode("utf-8")
+        pos += n
+        return text
+
+    def read_count():
+        nonlocal pos
+        (n,) = COUNT.unpack_from(view, pos)
+        pos += COUNT.size
+        return n
+
+    tileset = read_str()
+
+    tiles = array("H")
+    tiles.frombytes(view[pos:pos + width * height * 2])
+    if sys.byteorder == "big":
+        tiles.byteswap()
+    pos += width * height * 2
+
+    walls = []
+    for _ in range(read_count()):
+        wx, wy, length, orient = WALL.unpack_from(view, pos)
+        pos += WALL.size
+        walls.append([wx, wy, length, WALL_ORIENTS[orient]])
+
+    warps = []
+    for _ in range(read_count()):
+        x, y, w, h, dest_x, dest_y, facing = WARP.unpack_from(view, pos)
+        pos += WARP.size
+        warps.append({
+            "x": x,
+            "y": y,
+            "width": w,
+            "height": h,
+            "to_room": read_str(),
+            "dest_x": dest_x,
+            "dest_y": dest_y,
+            "dest_facing": None if facing == NO_FACING else FACINGS[facing]
+        })
+
+    (n,) = EXTRA_LEN.unpack_from(view, pos)
+    pos += EXTRA_LEN.size
+
+    data = json.loads(bytes(view[pos:pos + n]).decode("utf-8")) if n else {}
+    data.update({
+        "tileset": tileset,
+        "width": width,
+        "height": height,
+        "scrolling": bool(flags & FLAG_SCROLLING),
+        "tiles": tiles,
+        "walls": walls,
+        "warps": warps
+    })
+    return data
+
+
+def read_compiled_map(path):
+    with open(path, "rb") as f:
+        return decode_map(f.read())
+
+
+# ---------------------------------------------------------
+# Compiler entry point
+# ---------------------------------------------------------
+def compile_all(maps_dir=os.path.join("data", "maps")):
+    """Compile every JSON map in maps_dir; returns the written paths."""
+    written = []
+    for json_path in sorted(glob.glob(os.path.join(maps_dir, "*.json"))):
+        with open(json_path, "r") as f:
+            data = json.load(f)
+
+        out_path = compiled_path(json_path)
+        with open(out_path, "wb") as f:
+            f.write(compile_map(data))
+        written.append(out_path)
+
+    return written
+
+
+if __name__ == "__main__":
+    for path in compile_all():
+        print(f"compiled {path}")
@@ -87,14 +87,14 @@ def test_movement(map_obj, player, dx, dy):
 
     # Sliding up along diagonal walls
     if allowed_dy == 0 and dy < 0 and allowed_dx == 0:
-        for wx, wy, length, orient in map_obj.walls:
+        # Only the distinct diagonal orientations matter here; trying the
+        # same slide once per wall gave the same answer every time.
+        for orient in map_obj.slide_orients:
 
             if orient == "up_right":
                 slide_dx = SPEED
-            elif orient == "up_left":
-                slide_dx = -SPEED
             else:
-                continue
+                slide_dx = -SPEED
 
             nx, ny = px + slide_dx, py + dy
 
@@ -0,0 +1,79 @@
+# overworld/preloader.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+from overworld.map import load_map, is_map_loaded, read_map_data
+from overworld.tileset import get_shared_tileset, is_tileset_loaded, read_tileset_files
+
+
+def _read_room(name):
+    """
+    Worker-thread half of loading a room: parse the map JSON, read the
+    tileset metadata and decode the sheet PNG. No display calls here.
+    A tileset that is already cached is not read again (meta and sheet
+    come back as None).
+    """
+    data = read_map_data(name)
+    if is_tileset_loaded(data["tileset"]):
+        return data, None, None
+    meta, sheet = read_tileset_files(data["tileset"])
+    return data, meta, sheet
+
+
+class MapPreloader:
+    """
+    Loads rooms the player is about to warp into on a background thread.
+
+    request() queues a room; poll() (main thread, once per frame) finishes
+    any rooms whose files are ready by doing the pygame convert() and
+    handing the Map/Tileset to the shared caches, so the warp itself is
+    just a cache hit.
+
+    The thread is started on the first request() and stopped by
+    shutdown(); a later request() starts a new one.
+    """
+
+    def __init__(self, screen_width, screen_height):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        self.executor = None
+        self.pending = {}     # room name → Future
+        self.failed = set()   # rooms that could not be read (not retried)
+
+    def request(self, name):
+        """Start loading a room in the background unless already available."""
+        if name in self.pending or name in self.failed:
+            return
+        if is_map_loaded(name, self.screen_width, self.screen_height):
+            return
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending[name] = self.executor.submit(_read_room, name)
+
+    def poll(self):
+        """Finish any rooms whose background read has completed."""
+        for name, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[name]
+
+            try:
+                data, meta, sheet = future.result()
+
+                # (if the tileset was evicted since, the Map reloads it itself)
+                if sheet is not None and not is_tileset_loaded(data["tileset"]):
+                    get_shared_tileset(data["tileset"], meta, sheet)
+                load_map(name, self.screen_width, self.screen_height, data)
+            except Exception:
+                # Missing or broken room (bad JSON, unreadable sheet, ...):
+                # drop it and leave it for the warp itself to report
+                self.failed.add(name)
+
+    def shutdown(self):
+        """Drop queued rooms and stop the thread (running reads finish)."""
+        self.pending.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,69 @@
+# overworld/regions.py
+
+
+class RegionIndex:
+    """
+    Grid-bucketed index of rectangular trigger regions (warps, signs,
+    encounter zones, NPC triggers, ...).
+
+    Regions are stored in parallel lists and each grid cell holds the
+    indices of the regions touching it, so a query only looks at the
+    handful of regions near the rect instead of every region on the map.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+
+        # Parallel region arrays (index = region id)
+        self.kinds = []     # e.g. "warp"
+        self.rects = []     # (left, top, right, bottom) in world pixels
+        self.data = []      # the region's dict (warp destination, etc.)
+
+        # (cell_x, cell_y) → [region ids]
+        self.grid = {}
+
+    def add(self, kind, x, y, width, height, data):
+        """Insert a region and return its id."""
+        region_id = len(self.kinds)
+        left, top, right, bottom = x, y, x + width, y + height
+
+        self.kinds.append(kind)
+        self.rects.append((left, top, right, bottom))
+        self.data.append(data)
+
+        cell = self.cell_size
+        for cy in range(int(top // cell), int(bottom // cell) + 1):
+            for cx in range(int(left // cell), int(right // cell) + 1):
+                self.grid.setdefault((cx, cy), []).append(region_id)
+
+        return region_id
+
+    def query(self, x, y, w, h, kind=None):
+        """
+        Return (kind, data) for every region overlapping (x, y, w, h),
+        in insertion order. Touching edges do not count as overlap.
+        Pass kind to only return regions of that kind.
+        """
+        left, right = x, x + w
+        top, bottom = y, y + h
+
+        cell = self.cell_size
+        candidates = set()
+        for cy in range(int(top // cell), int(bottom // cell) + 1):
+            for cx in range(int(left // cell), int(right // cell) + 1):
+                candidates.update(self.grid.get((cx, cy), ()))
+
+        hits = []
+        for region_id in sorted(candidates):
+            if kind is not None and self.kinds[region_id] != kind:
+                continue
+
+            r_left, r_top, r_right, r_bottom = self.rects[region_id]
+            if not (right <= r_left or left >= r_right or
+                    bottom <= r_top or top >= r_bottom):
+                hits.append((self.kinds[region_id], self.data[region_id]))
+
+        return hits
+
+    def __len__(self):
+        return len(self.kinds)
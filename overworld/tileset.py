@@ -1,15 +1,56 @@
 import json
 import os
 import pygame
-from PIL import Image
+from overworld.asset_cache import AssetCache, surface_bytes
+from constants import SCALE, TILESET_CACHE_BUDGET, TILESET_TILE_BUDGET
+
+
+# Tilesets shared between every Map that references them,
+# keyed by (name, scale) and bounded by TILESET_CACHE_BUDGET
+_tileset_cache = AssetCache(TILESET_CACHE_BUDGET, lambda t: t.memory_size())
+
+
+def get_shared_tileset(name, meta=None, sheet=None):
+    """
+    Return the process-wide Tileset for this name, loading it on a miss.
+    meta/sheet may come from read_tileset_files() on a worker thread.
+    """
+    key = (name, SCALE)
+    return _tileset_cache.get(key, lambda: _new_shared_tileset(key, meta, sheet))
+
+
+def _new_shared_tileset(key, meta, sheet):
+    tileset = Tileset(key[0], meta, sheet)
+    # Tiles are built after insert; have the cache re-measure as they are
+    tileset.on_resize = lambda: _tileset_cache.resize(key)
+    return tileset
+
+
+def is_tileset_loaded(name):
+    return (name, SCALE) in _tileset_cache
+
+
+def read_tileset_files(name):
+    """
+    Read tileset metadata and decode its sheet without touching the
+    display, so it is safe to run off the main thread. The returned
+    sheet still needs convert_alpha(), which Tileset does on construction.
+    """
+    meta_path = os.path.join("data", "tilesets", f"{name}.json")
+    with open(meta_path, "r") as f:
+        meta = json.load(f)
+
+    image_path = os.path.join("data", "tilesets", meta["image"])
+    return meta, pygame.image.load(image_path)
 
 
 class Tileset:
-    def __init__(self, name):
+    def __init__(self, name, meta=None, sheet=None):
         self.name = name
 
         # Load metadata (tile size, sheet name, etc.)
-        meta = self.load_metadata(name)
+        if meta is None:
+            meta = self.load_metadata(name)
 
         self.tile_width = meta["tile_width"]
         self.tile_height = meta["tile_height"]
@@ -20,12 +61,19 @@ class Tileset:
         # Global scale factor for tiles
         self.scale = meta.get("scale", 4)
 
-        # Load the tilesheet image (PIL)
-        self.sheet = self.load_sheet(self.image_name)
+        # Load the tilesheet once as a single unscaled pygame.Surface.
+        # Tiles are cut and scaled from it on first use only.
+        if sheet is None:
+            self.sheet = self.load_sheet(self.image_name)
+        else:
+            self.sheet = sheet.convert_alpha()
+
+        # tile_id → scaled pygame.Surface (filled lazily by get()),
+        # least recently used tiles dropped past TILESET_TILE_BUDGET
+        self.cache = AssetCache(TILESET_TILE_BUDGET, surface_bytes)
 
-        # Preload + cache all tiles as pygame.Surface
-        self.cache = {}
-        self.load_all_tiles()
+        # Called after get() builds a tile (see get_shared_tileset)
+        self.on_resize = None
 
     # ---------------------------------------------------------
     # Loading
@@ -37,50 +85,39 @@ class Tileset:
             return json.load(f)
 
     def load_sheet(self, image_name):
-        """Load the tilesheet image using PIL."""
+        """Load the tilesheet image as a pygame.Surface."""
         image_path = os.path.join("data", "tilesets", image_name)
-        return Image.open(image_path).convert("RGBA")
+        return pygame.image.load(image_path).convert_alpha()
 
     # ---------------------------------------------------------
     # Tile Extraction + Caching
     # ---------------------------------------------------------
-    def load_all_tiles(self):
-        """Slice, scale, and cache every tile as a pygame.Surface."""
+    def load_tile(self, tile_id):
+        """Cut one tile out of the sheet and scale it (nearest neighbour)."""
         tw = self.tile_width
         th = self.tile_height
-        sw = tw * self.scale
-        sh = th * self.scale
-
-        tile_id = 0
-
-        for row in range(self.rows):
-            for col in range(self.columns):
-                x = col * tw
-                y = row * th
-
-                # Crop tile (PIL)
-                tile = self.sheet.crop((x, y, x + tw, y + th))
-
-                # Scale tile (PIL)
-                tile = tile.resize((sw, sh), Image.NEAREST)
 
-                # Convert PIL → pygame.Surface
-                mode = tile.mode
-                size = tile.size
-                data = tile.tobytes()
+        col = tile_id % self.columns
+        row = tile_id // self.columns
+        if not 0 <= row < self.rows:
+            raise KeyError(tile_id)
 
-                if mode == "RGBA":
-                    surface = pygame.image.fromstring(data, size, mode).convert_alpha()
-                else:
-                    surface = pygame.image.fromstring(data, size, mode).convert()
+        tile = self.sheet.subsurface(pygame.Rect(col * tw, row * th, tw, th))
+        return pygame.transform.scale(tile, (tw * self.scale, th * self.scale))
 
-                # Store in cache
-                self.cache[tile_id] = surface
-                tile_id += 1
+    def memory_size(self):
+        """Pixel memory held by the sheet and the built tiles."""
+        return surface_bytes(self.sheet) + self.cache.total_bytes()
 
     # ---------------------------------------------------------
     # Access
     # ---------------------------------------------------------
     def get(self, tile_id):
-        """Return a cached pygame.Surface tile."""
-        return self.cache[tile_id]
+        """Return the scaled pygame.Surface for a tile, building it on first use."""
+        if tile_id in self.cache:
+            return self.cache.get(tile_id, None)
+
+        surface = self.cache.get(tile_id, lambda: self.load_tile(tile_id))
+        if self.on_resize is not None:
+            self.on_resize()
+        return surface
@@ -1,12 +1,28 @@
-import math
 import random
 
 
 class Pokemon:
     """
     Core Pokémon data model used by battle, menus, and the Pokédex.
+
+    Derived stats (max HP/MP, attack, ...) are computed from level and
+    base stats on first access and recomputed after the level changes,
+    so building a Pokémon only stores what it was given.
     """
 
+    __slots__ = (
+        "pokedex_number", "name", "is_shiny",
+        "_level", "base_stats", "bst",
+        "affinities", "potential",
+        "learnset", "moves",
+        "is_guarding",
+        "attack_buff", "defense_buff", "speed_buff",
+        "attack_buff_turns", "defense_buff_turns", "speed_buff_turns",
+        "_remaining_hp", "_remaining_mp",
+        "sprite_column",
+        "_derived",
+    )
+
     def __init__(
         self,
         pokedex_number,
@@ -26,7 +42,7 @@ class Pokemon:
         self.is_shiny = is_shiny
 
         # Level & stats
-        self.level = level
+        self._level = level
         self.base_stats = stats or {}
         self.bst = bst
 
@@ -49,28 +65,116 @@ class Pokemon:
         self.defense_buff_turns = 0
         self.speed_buff_turns = 0
 
-        self.base_max_hp   = self.base_stats.get("hp", 1)
-        self.base_attack  = self.base_stats.get("atk", 1)
-        self.base_defense  = self.base_stats.get("def", 1)
-        self.base_spattack  = self.base_stats.get("spatk", 1)
-        self.base_spdefense  = self.base_stats.get("spdef", 1)
-        self.base_speed  = self.base_stats.get("spd", 1)
+        # None = full (tracks max_hp / max_mp until first assignment)
+        self._remaining_hp = None
+        self._remaining_mp = None
 
-        # HP formula
-        self.max_hp = int(self.level + 10 + math.floor((2 * self.base_max_hp * self.level) / 100))
-        self.remaining_hp = self.max_hp
+        # (max_hp, attack, defense, spattack, spdefense, speed), built lazily
+        self._derived = None
 
+    # ---------------------------------------------------------
+    # Level & derived stats
+    # ---------------------------------------------------------
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, value):
+        if value != self._level:
+            self._level = value
+            self._derived = None
+
+    def _stats(self):
+        derived = self._derived
+        if derived is None:
+            base = self.base_stats
+            level = self._level
+
+            derived = self._derived = (
+                # HP formula
+                level + 10 + (2 * base.get("hp", 1) * level) // 100,
+                # Other stats
+                5 + (2 * base.get("atk", 1) * level) // 100,
+                5 + (2 * base.get("def", 1) * level) // 100,
+                5 + (2 * base.get("spatk", 1) * level) // 100,
+                5 + (2 * base.get("spdef", 1) * level) // 100,
+                5 + (2 * base.get("spd", 1) * level) // 100,
+            )
+        return derived
+
+    @property
+    def max_hp(self):
+        return self._stats()[0]
+
+    @property
+    def max_mp(self):
         # MP = HP for now
-        self.max_mp = self.max_hp
-        self.remaining_mp = self.max_mp
+        return self._stats()[0]
 
-        # Other stats
-        self.attack     = int(5 + math.floor((2 * self.base_attack * self.level) / 100))
-        self.defense    = int(5 + math.floor((2 * self.base_defense * self.level) / 100))
-        self.spattack   = int(5 + math.floor((2 * self.base_spattack * self.level) / 100))
-        self.spdefense  = int(5 + math.floor((2 * self.base_spdefense * self.level) / 100))
-        self.speed      = int(5 + math.floor((2 * self.base_speed * self.level) / 100))
+    @property
+    def attack(self):
+        return self._stats()[1]
+
+    @property
+    def defense(self):
+        return self._stats()[2]
+
+    @property
+    def spattack(self):
+        return self._stats()[3]
+
+    @property
+    def spdefense(self):
+        return self._stats()[4]
+
+    @property
+    def speed(self):
+        return self._stats()[5]
 
+    @property
+    def remaining_hp(self):
+        if self._remaining_hp is None:
+            return self.max_hp
+        return self._remaining_hp
+
+    @remaining_hp.setter
+    def remaining_hp(self, value):
+        self._remaining_hp = value
+
+    @property
+    def remaining_mp(self):
+        if self._remaining_mp is None:
+            return self.max_mp
+        return self._remaining_mp
+
+    @remaining_mp.setter
+    def remaining_mp(self, value):
+        self._remaining_mp = value
+
+    @property
+    def base_max_hp(self):
+        return self.base_stats.get("hp", 1)
+
+    @property
+    def base_attack(self):
+        return self.base_stats.get("atk", 1)
+
+    @property
+    def base_defense(self):
+        return self.base_stats.get("def", 1)
+
+    @property
+    def base_spattack(self):
+        return self.base_stats.get("spatk", 1)
+
+    @property
+    def base_spdefense(self):
+        return self.base_stats.get("spdef", 1)
+
+    @property
+    def base_speed(self):
+        return self.base_stats.get("spd", 1)
 
     # ---------------------------------------------------------
     # Move helpers
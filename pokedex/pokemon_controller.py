@@ -1,11 +1,7 @@
-import os
 import random
 
-from data.smt.smt_stats import (
-    load_pkmn_from_json,
-    get_species_by_number,
-    create_pokemon_from_species
-)
+from data.smt.game_data import get_game_data
+from data.smt.smt_stats import create_pokemon_from_species
 
 
 class PokemonController:
@@ -15,22 +11,11 @@ class PokemonController:
     """
 
     def __init__(self):
-        # Path to smt_stats.json relative to this file
-        json_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(__file__),  # pokedex/
-                "..",                       # data/
-                "data",
-                "smt",
-                "smt_stats.json"
-            )
-        )
-
-        # Load raw species data (NOT Pokémon instances)
-        self.species_list = load_pkmn_from_json(json_path)
+        # Own list of the shared species entries (this list gets re-sorted)
+        self.species_list = list(get_game_data().species)
 
         # Sort species by Pokédex number
-        self.species_list.sort(key=lambda s: s["no"])
+        self.species_list.sort(key=lambda s: s.no)
 
         # Current index (0-based)
         self.index = 0
@@ -47,7 +32,7 @@ class PokemonController:
         return self.filtered_list if self.filtered_list is not None else self.species_list
 
     def _current_species(self):
-        """Return the species dict at the current index."""
+        """Return the Species at the current index."""
         return self._active_list()[self.index]
 
     # ---------------------------------------------------------
@@ -72,7 +57,11 @@ class PokemonController:
         This ensures the Pokédex never shares Pokémon objects.
         """
         species = self._current_species()
-        return create_pokemon_from_species(species, level=species.get("level", 1))
+        return create_pokemon_from_species(species, level=species.level)
+
+    def get_current_species(self):
+        """Return the (shared, read-only) Species at the current index."""
+        return self._current_species()
 
     def get_current_index(self):
         return self.index + 1
@@ -102,17 +91,17 @@ class PokemonController:
 
         # 1. Exact match
         for i, s in enumerate(lst):
-            if s["name"].lower() == text:
+            if s.name.lower() == text:
                 return i
 
         # 2. Startswith match
         for i, s in enumerate(lst):
-            if s["name"].lower().startswith(text):
+            if s.name.lower().startswith(text):
                 return i
 
         # 3. Contains match
         for i, s in enumerate(lst):
-            if text in s["name"].lower():
+            if text in s.name.lower():
                 return i
 
         # 4. Fuzzy match
@@ -122,41 +111,41 @@ class PokemonController:
             mismatch = sum(1 for a, b in zip(name, text) if a != b)
             return length_diff + mismatch
 
-        return min(range(len(lst)), key=lambda i: score(lst[i]["name"]))
+        return min(range(len(lst)), key=lambda i: score(lst[i].name))
 
     # ---------------------------------------------------------
     # Sorting
     # ---------------------------------------------------------
 
     def sort_by_bst_ascending(self):
-        self.species_list.sort(key=lambda s: s["bst"])
+        self.species_list.sort(key=lambda s: s.bst)
         self.index = 0
 
     def sort_by_bst_descending(self):
-        self.species_list.sort(key=lambda s: s["bst"], reverse=True)
+        self.species_list.sort(key=lambda s: s.bst, reverse=True)
         self.index = 0
 
     def sort_by_number(self):
-        self.species_list.sort(key=lambda s: s["no"])
+        self.species_list.sort(key=lambda s: s.no)
         self.index = 0
 
     def sort_by_stat(self, stat_name):
         self.species_list.sort(
-            key=lambda s: s["stats"].get(stat_name.upper(), 0),
+            key=lambda s: s.stat(stat_name),
             reverse=True
         )
         self.index = 0
 
     def sort_by_affinity(self, index):
         self.species_list.sort(
-            key=lambda s: s["affinities"][index],
+            key=lambda s: s.affinities[index],
             reverse=True
         )
         self.index = 0
 
     def sort_by_potential(self, index):
         self.species_list.sort(
-            key=lambda s: s.get("potential", [0] * 9)[index],
+            key=lambda s: s.potential[index],
             reverse=True
         )
         self.index = 0
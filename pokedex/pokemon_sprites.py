@@ -1,5 +1,4 @@
 import os
-from PIL import Image
 import pygame
 
 # Constants for the new sheet
@@ -22,20 +21,18 @@ PLAYER_H = 52
 
 
 def _load_big_sheet():
+    """
+    Load the sheet once. Every ALPHA_KEY pixel is made transparent by a
+    single colorkey on the whole sheet (the sheet itself is fully opaque).
+    """
     global _big_sheet
     if _big_sheet is None:
-        sheet = Image.open(BIG_SHEET_PATH).convert("RGBA")
+        sheet = pygame.image.load(BIG_SHEET_PATH).convert()
+        sheet.set_colorkey(ALPHA_KEY)
         _big_sheet = sheet
     return _big_sheet
 
 
-def _pil_to_pygame(image):
-    mode = image.mode
-    size = image.size
-    data = image.tobytes()
-    return pygame.image.fromstring(data, size, mode).convert_alpha()
-
-
 def load_pokemon_sprite(row, column, scale=1):
     """
     Load a single Pokémon sprite from the giant 69x69 grid sheet.
@@ -49,28 +46,17 @@ def load_pokemon_sprite(row, column, scale=1):
 
     # Horizontal is fine
     sx0 = x0 + BORDER
-    sx1 = sx0 + SPRITE
 
     # Nudge vertical crop 1px up to avoid bottom bleed
     sy0 = y0 + BORDER #-1
-    sy1 = sy0 + SPRITE
-
-    frame = sheet.crop((sx0, sy0, sx1, sy1))
 
-    # Apply alpha key cleanup
-    data = frame.getdata()
-    cleaned = []
-    for r, g, b, a in data:
-        if (r, g, b) == ALPHA_KEY:
-            cleaned.append((r, g, b, 0))
-        else:
-            cleaned.append((r, g, b, a))
-    frame.putdata(cleaned)
+    frame = sheet.subsurface(pygame.Rect(sx0, sy0, SPRITE, SPRITE))
 
     if scale != 1:
-        frame = frame.resize((SPRITE * scale, SPRITE * scale), Image.NEAREST)
+        frame = pygame.transform.scale(frame, (SPRITE * scale, SPRITE * scale))
 
-    return _pil_to_pygame(frame)
+    # Colorkey → per-pixel alpha (keyed pixels get alpha 0)
+    return frame.convert_alpha()
 
 
 
@@ -3,9 +3,10 @@ from pokedex.ui_layout import (
     SPRITE_X, SPRITE_Y,
     PANEL_X, PANEL_Y, PANEL_WIDTH,
     FONT_PATH, FONT_SIZE_TITLE, FONT_SIZE_TEXT,
-    COLOR_TEXT
+    COLOR_TEXT, PANEL_CACHE_BUDGET
 )
 from pokedex.pokemon_sprites import load_pokemon_sprite
+from overworld.asset_cache import AssetCache, surface_bytes
 
 
 # ---------------------------------------------------------
@@ -37,6 +38,13 @@ class PokemonView:
         # Cache for sprites
         self.sprite_cache = {}
 
+        # Pre-rendered panels keyed by (species no, sprite column, size);
+        # navigation picks a different key, so nothing needs invalidating
+        self.panel_cache = AssetCache(PANEL_CACHE_BUDGET, surface_bytes)
+
+        # (text, rendered surface) for the search box
+        self.input_surface = None
+
         # ---------------------------------------------------------
         # Input box for jumping to a Pokédex number
         # ---------------------------------------------------------
@@ -189,11 +197,19 @@ class PokemonView:
 
 
     # ---------------------------------------------------------
-    # Main draw function
+    # Panel rendering (cached per species + sprite column)
     # ---------------------------------------------------------
-    def draw(self, screen):
+    def render_panel(self, size):
+        """
+        Render everything that only depends on the selected species and
+        sprite column onto one opaque surface: sprite, info panel,
+        affinity/potential grid, sort buttons and the search label.
+        """
         pokemon = self.controller.get_current_pokemon()
 
+        screen = pygame.Surface(size).convert()
+        screen.fill((0, 0, 0))
+
         # -----------------------------
         # Draw sprite
         # -----------------------------
@@ -358,13 +374,8 @@ class PokemonView:
 
 
         # -----------------------------
-        # Draw input box
+        # Draw search label
         # -----------------------------
-        pygame.draw.rect(screen, self.input_color, self.input_rect, border_radius=4)
-
-        txt_surface = self.font_text.render(self.input_text, True, (0, 0, 0))
-        screen.blit(txt_surface, (self.input_rect.x + 8, self.input_rect.y + 6))
-
         label = self.font_text.render("Search:", True, COLOR_TEXT)
         screen.blit(label, (self.input_rect.x - 80, self.input_rect.y + 6))
 
@@ -382,3 +393,28 @@ class PokemonView:
         screen.blit(asc_label, (self.button_sort_asc.x + 20, self.button_sort_asc.y + 8))
         screen.blit(desc_label, (self.button_sort_desc.x + 20, self.button_sort_desc.y + 8))
         screen.blit(num_label, (self.button_sort_number.x + 20, self.button_sort_number.y + 8))
+
+        return screen
+
+
+    # ---------------------------------------------------------
+    # Main draw function
+    # ---------------------------------------------------------
+    def draw(self, screen):
+        species = self.controller.get_current_species()
+        key = (species.no, self.col, screen.get_size())
+
+        panel = self.panel_cache.get(key, lambda: self.render_panel(screen.get_size()))
+        screen.blit(panel, (0, 0))
+
+        # -----------------------------
+        # Draw input box
+        # -----------------------------
+        pygame.draw.rect(screen, self.input_color, self.input_rect, border_radius=4)
+
+        if self.input_surface is None or self.input_surface[0] != self.input_text:
+            self.input_surface = (
+                self.input_text,
+                self.font_text.render(self.input_text, True, (0, 0, 0))
+            )
+        screen.blit(self.input_surface[1], (self.input_rect.x + 8, self.input_rect.y + 6))
@@ -17,3 +17,6 @@ PANEL_X = 400
 PANEL_Y = 50
 PANEL_WIDTH = 450
 PANEL_HEIGHT = 480
+
+# Memory budget for cached pre-rendered Pokédex panels (a few full screens)
+PANEL_CACHE_BUDGET = 16 * 1024 * 1024
@@ -3,20 +3,44 @@ from constants import *
 from stack import Stack
 from state.state_manager import GameState
 
-from data.smt.smt_stats import load_pkmn_from_json, create_pokemon_from_species, get_species_by_number
-from data.smt.smt_moves import load_moves
-from data.smt.smt_items import SMT_ITEMS
+from data.smt.smt_stats import create_pokemon_from_species
+from data.smt.game_data import get_game_data
 from pokedex.pokemon import Pokemon
 
+from battle.battle_ai import BattleSnapshot, EnemyAI
+from battle.battle_ai_worker import AIWorker
 from battle.battle_constants import *
+from battle.battle_damage import calculate_damage
+from battle.battle_rules import (
+    consume_full_turn, consume_half_turn, consume_wipe_turn,
+    has_press_turns, tick_buffs
+)
 from battle.battle_renderer import BattleRenderer
+from battle.battle_text import TextLayout
 
 class BattleState(GameState):
     def __init__(self):
+        # Game data, teams and the renderer (fonts, UI and team sprites)
+        # are loaded on the first enter(), not at startup
+        self.renderer = None
+
+    def enter(self):
+        if self.renderer is None or self.is_over:
+            self._init_battle()
+        elif self.state == STATE_ENEMY_THINK:
+            # Left mid-decision and the search was dropped: ask again
+            self.enter_state(STATE_ENEMY_THINK)
+
+    def exit(self):
+        # Stop the enemy search thread while the battle is off screen
+        self.ai_worker.shutdown()
+
+    def _init_battle(self):
         # ========================= START INIT =================================
-        self.pkmn = load_pkmn_from_json(FILENAME_STATS)
-        self.moves = load_moves(FILENAME_MOVES)
-        self.items = SMT_ITEMS
+        game_data = get_game_data()
+        self.pkmn = game_data.species
+        self.moves = game_data.moves
+        self.items = game_data.items
 
         self._init_teams()
         # player/enemy_team[ turn_index ] is active
@@ -24,6 +48,13 @@ class BattleState(GameState):
         # [2, 2, 2, 2] where 2 is fresh, 1 blinking, 0 gone
         self.press_turns = FRESH_PRESS_TURNS.copy()
         self.is_player_turn = True
+        # Enemy side: who acts, who it hits, and the search deciding it
+        self.enemy_turn_index = 0
+        self.enemy_target_index = 0
+        self.enemy_decision = None
+        self.ai_worker = AIWorker(EnemyAI(self.moves))
+        # Set once a side is wiped out (see STATE_BATTLE_END)
+        self.is_over = False
 
         self.inventory = {
             "Medicine": 2,
@@ -231,9 +262,18 @@ class BattleState(GameState):
             self.enter_state(next_state)
             return
 
-        if not self.is_player_turn:
-            pass
-        if self.state == STATE_SCROLL:
+        if self.state == STATE_ENEMY_THINK:
+            # The search runs on the worker; keep animating until it answers
+            self.think_frames += 1
+            if self.ai_worker.thinking:
+                decision = self.ai_worker.poll()
+                if decision is not None:
+                    self.enemy_decision = decision
+                if self.ai_worker.thinking:
+                    return
+            if self.think_frames >= AI_THINK_MIN_FRAMES:
+                self.enter_state(STATE_ENEMY_SINGLE_TARGET_CALC)
+        elif self.state == STATE_SCROLL:
             if not self.scroll_is_done:
                 chars_per_second = SCROLL_SPEED * SCROLL_DELAY_CONSTANT
                 chars_per_frame = chars_per_second / (SCROLL_CONSTANT * TARGET_FPS)
@@ -262,14 +302,18 @@ class BattleState(GameState):
                 self.dmg_hp_scrolls[0] -= step
             else:
                 self.enter_state(STATE_SCROLL)
-                self.next_state.push(STATE_COMPLETE_PLAYER_TURN)
+                if self.is_player_turn:
+                    self.next_state.push(STATE_COMPLETE_PLAYER_TURN)
+                else:
+                    self.next_state.push(STATE_COMPLETE_ENEMY_TURN)
 
 
         
     def enter_state(self, state):
         if state == STATE_MAIN:
             if self.state in (None,
-                              STATE_COMPLETE_PLAYER_TURN):
+                              STATE_COMPLETE_PLAYER_TURN,
+                              STATE_COMPLETE_ENEMY_TURN):
                 # Used for menus
                 self.menu_cursor_x = 0
                 self.menu_cursor_y = 0
@@ -281,6 +325,7 @@ class BattleState(GameState):
             self.target_index = 0
             # Generic dialogue to scroll
             self.scroll_text = ""
+            self.scroll_layout = TextLayout(self.scroll_text)
             self.scroll_index = 0
             self.scroll_is_done = False
             self.scroll_is_input_required = False
@@ -337,6 +382,7 @@ class BattleState(GameState):
             self.scroll_is_done = False
             next = self.next_text.pop()
             self.scroll_text = next[0]
+            self.scroll_layout = TextLayout(self.scroll_text)
             self.scroll_is_input_required = next[1]
             scroll_flag_miss = next[2]
             scroll_flag_weak = next[3]
@@ -371,104 +417,22 @@ class BattleState(GameState):
             move_name = attacker.moves[self.skills_cursor + self.skills_scroll]
             move = self.moves[move_name]
             move_mp_cost = move["mp"]
-            move_power = move["power"]
-            move_element = move["element"]
-            move_accuracy = move["accuracy"]
-            move_type = move["type"]
-
-            defender_affinity = defender.affinities[ELEMENT_INDEX[move_element]]
 
             attacker.remaining_mp -= move_mp_cost
 
-            odds_hit = move_accuracy / 100
-            odds_hit *= DMG_BUFFS_ACC[attacker.speed_buff]
-            odds_hit /= DMG_BUFFS_ACC[defender.speed_buff]
-            atk_norm = (attacker.speed - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
-            def_norm = (defender.speed - DMG_SPEED_MIN) / (DMG_SPEED_MAX - DMG_SPEED_MIN)
-            odds_hit *= 1 + (DMG_SPEED_CONSTANT * (atk_norm - def_norm))
-            odds_hit = max(0.0, min(1.0, odds_hit))
-
-            if  (random.random() <= odds_hit) or \
-                (defender_affinity >= AFFINITY_NULL):
-                # hit
-                is_crit = (random.random() < CHANCE_CRIT) and (move_element == "Physical")
-                reflected = (AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB)
-                nontarget = attacker
-                target = defender
-                if reflected:
-                    nontarget = defender
-                    target = attacker
-                target_affinity = target.affinities[ELEMENT_INDEX[move_element]]
-                if reflected:
-                    target_affinity = min(AFFINITY_NULL, target_affinity)
-
-                damage = move_power
-                # atk/def
-                if (move_type == "Physical"):
-                    damage *= nontarget.attack
-                    damage /= target.defense
-                elif (move_type == "Special"):
-                    damage *= nontarget.spattack
-                    damage /= target.spdefense
-                damage *= DMG_BUFFS[nontarget.attack_buff]
-                damage /= DMG_BUFFS[target.defense_buff]
-                # level
-                damage *= (((2 * nontarget.level)/5)+2)
-                damage /= 50
-                damage += 2
-                # crit
-                if is_crit:
-                    damage *= DMG_CRIT
-                # affinities
-                if ((target_affinity < AFFINITY_NEUTRAL) and \
-                    (not target.is_guarding)):
-                    damage *= DMG_WEAK
-                if (AFFINITY_RESIST <= target_affinity < AFFINITY_NULL):
-                    damage *= DMG_RESIST
-                if (AFFINITY_NULL <= target_affinity < AFFINITY_REFLECT):
-                    damage *= DMG_IMMUNE
-                # potentials
-                potential = nontarget.potential[ELEMENT_INDEX[move_element]]
-                damage *= (1.0 + (potential / 18))
-                # random
-                damage *= random.randint(85, 100) / 100
-                # round
-                damage = int(damage)
-
-                actual_dealt = damage
-                if target.remaining_hp < damage:
-                    actual_dealt = target.remaining_hp
-                t = ""
-                if defender_affinity == AFFINITY_NEUTRAL:
-                    t = f"Dealt {actual_dealt} damage."
-                else:
-                    if defender_affinity < AFFINITY_NEUTRAL:
-                        t = AFFINITY_TEXT_WEAK
-                    elif AFFINITY_RESIST <= defender_affinity < AFFINITY_NULL:
-                        t = AFFINITY_TEXT_RESIST
-                    elif AFFINITY_NULL <= defender_affinity < AFFINITY_REFLECT:
-                        t = AFFINITY_TEXT_NULL
-                    elif AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB:
-                        t = AFFINITY_TEXT_REFLECT
-                    elif defender_affinity >= AFFINITY_ABSORB:
-                        t = AFFINITY_TEXT_ABSORB
-                        t += f" \n Recovered {actual_dealt} HP."
-                    if (defender_affinity < AFFINITY_NEUTRAL
-                        or AFFINITY_RESIST <= defender_affinity < AFFINITY_NULL
-                        or AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB
-                    ):
-                        t += f" \n Dealt {actual_dealt} damage."
-                if is_crit:
-                    t += f" \n A critical hit!"
-                flag_weak = (is_crit or (defender_affinity < AFFINITY_NEUTRAL)) and not defender.is_guarding
-                flag_neutral = (AFFINITY_NEUTRAL <= defender_affinity < AFFINITY_NULL) and not is_crit
-                flag_null = (defender_affinity >= AFFINITY_NULL)
-                self.next_text.push((t,
+            result = calculate_damage(attacker, defender, move)
+            defender_affinity = result.affinity
+
+            if result.hit:
+                damage = result.damage
+                target = attacker if result.reflected else defender
+
+                self.next_text.push((self._hit_text(result, target),
                                      True,
                                      False,
-                                     flag_weak,
-                                     flag_neutral,
-                                     flag_null))
+                                     result.weak,
+                                     result.neutral,
+                                     result.null))
                 
                 defender.is_guarding = False
                 
@@ -498,6 +462,7 @@ class BattleState(GameState):
             else:
                 # missed
                 self.scroll_is_input_required = True
+                self.next_state.push(STATE_COMPLETE_PLAYER_TURN)
                 self.next_text.push(("But it missed!", 
                                      True,
                                      True,
@@ -527,23 +492,129 @@ class BattleState(GameState):
                                  False))
             self.next_state.push(STATE_WAIT)
         elif state == STATE_COMPLETE_PLAYER_TURN:
-            if not any(v > 0 for v in self.press_turns):
-                self.is_player_turn = False
-                self.press_turns = FRESH_PRESS_TURNS.copy()
-                for e in self.enemy_team:
-                    e.attack_buff_turns = max(0, e.attack_buff_turns - 1)
-                    e.defense_buff_turns = max(0, e.defense_buff_turns - 1)
-                    e.speed_buff_turns = max(0, e.speed_buff_turns - 1)
-                    if e.attack_buff_turns == 0:
-                        e.attack_buff = 0
-                    if e.defense_buff_turns == 0:
-                        e.defense_buff = 0
-                    if e.speed_buff_turns == 0:
-                        e.speed_buff = 0
-            self.turn_index = (self.turn_index + 1) % len(self.player_team)
-            if self.is_player_turn:
-                self.player_team[self.turn_index].is_guarding = False
-            self.pending_state = STATE_MAIN
+            if not self._end_if_wiped():
+                if not has_press_turns(self.press_turns):
+                    self.is_player_turn = False
+                    self.press_turns = FRESH_PRESS_TURNS.copy()
+                    tick_buffs(self.enemy_team)
+                self.turn_index = self._next_living(self.player_team, self.turn_index + 1)
+                if self.is_player_turn:
+                    self.player_team[self.turn_index].is_guarding = False
+                    self.pending_state = STATE_MAIN
+                else:
+                    self.pending_state = STATE_ENEMY_THINK
+        elif state == STATE_ENEMY_THINK:
+            self.enemy_turn_index = self._next_living(self.enemy_team, self.enemy_turn_index)
+            self.enemy_decision = None
+            self.think_frames = 0
+            self.think_text = TEXT_ENEMY_THINKING.format(self.enemy_team[self.enemy_turn_index].name)
+            self.draw_player_bounce = False
+            self.draw_hp_bounce = False
+            self.draw_text_finished = False
+            self.draw_anim_skill = False
+            self.draw_mp_cost = False
+            self.draw_dmg_hp_scroll_player = False
+            self.draw_dmg_hp_scroll_enemy = False
+            # Searched on the worker thread from a copy of the teams
+            self.ai_worker.request(BattleSnapshot.capture(self.enemy_team,
+                                                          self.player_team,
+                                                          self.press_turns,
+                                                          self.enemy_turn_index))
+        elif state == STATE_ENEMY_SINGLE_TARGET_CALC:
+            attacker = self.enemy_team[self.enemy_turn_index]
+            decision = self.enemy_decision
+
+            if decision is None:
+                # Nothing usable, or no answer in time: the enemy passes
+                self._consume_half_turn()
+                self.next_state.push(STATE_COMPLETE_ENEMY_TURN)
+                self.next_text.push((f"{attacker.name} hesitates...",
+                                     False,
+                                     False,
+                                     False,
+                                     False,
+                                     False))
+                self.pending_state = STATE_SCROLL
+            else:
+                self.enemy_target_index = decision.target_index
+                defender = self.player_team[self.enemy_target_index]
+                move_name = decision.move_name
+                move = self.moves[move_name]
+
+                attacker.remaining_mp -= move["mp"]
+
+                result = calculate_damage(attacker, defender, move)
+
+                if result.hit:
+                    target = attacker if result.reflected else defender
+                    self.next_text.push((self._hit_text(result, target),
+                                         True,
+                                         False,
+                                         result.weak,
+                                         result.neutral,
+                                         result.null))
+
+                    defender.is_guarding = False
+
+                    hp_target = target.remaining_hp - result.damage
+                    hp_target = max(0, hp_target)
+                    hp_target = min(hp_target, target.max_hp)
+
+                    self.dmg_hp_targets = [hp_target]
+                    self.dmg_hp_scrolls = [target.remaining_hp]
+                    target.remaining_hp = hp_target
+                    # Only the player side's HP panel is up on the enemy turn
+                    self.draw_dmg_hp_scroll_player = not result.reflected
+                    self.draw_dmg_hp_scroll_enemy = False
+                    self.next_state.push(STATE_PLAYER_SINGLE_TARGET_HP)
+
+                    self.next_wait.push((WAIT_FRAMES_BEFORE_HP,
+                                         True,
+                                         False))
+                    self.next_state.push(STATE_WAIT)
+                else:
+                    self.next_state.push(STATE_COMPLETE_ENEMY_TURN)
+                    self.next_text.push(("But it missed!",
+                                         True,
+                                         True,
+                                         False,
+                                         False,
+                                         False))
+                    self.next_state.push(STATE_SCROLL)
+
+                if move_name == "Attack":
+                    announce = f"{attacker.name} attacks {defender.name}!"
+                else:
+                    announce = f"{attacker.name} uses {move_name} on {defender.name}!"
+                self.next_text.push((announce,
+                                     False,
+                                     False,
+                                     False,
+                                     False,
+                                     False))
+                self.pending_state = STATE_SCROLL
+
+                self.next_wait.push((WAIT_FRAMES_ANNOUNCE_SKILL,
+                                     True,
+                                     False))
+                self.next_state.push(STATE_WAIT)
+        elif state == STATE_COMPLETE_ENEMY_TURN:
+            if not self._end_if_wiped():
+                if not has_press_turns(self.press_turns):
+                    self.is_player_turn = True
+                    self.press_turns = FRESH_PRESS_TURNS.copy()
+                    tick_buffs(self.player_team)
+                self.enemy_turn_index = (self.enemy_turn_index + 1) % len(self.enemy_team)
+                if self.is_player_turn:
+                    self.turn_index = self._next_living(self.player_team, self.turn_index)
+                    self.player_team[self.turn_index].is_guarding = False
+                    self.pending_state = STATE_MAIN
+                else:
+                    self.pending_state = STATE_ENEMY_THINK
+        elif state == STATE_BATTLE_END:
+            # Back to the overworld; entering the battle again starts anew
+            self.is_over = True
+            self.change_request = BATTLE_END_STATE
         elif state == STATE_INFO:
             self.draw_press_turn = False
             self.draw_darken = True
@@ -554,8 +625,7 @@ class BattleState(GameState):
         # ========================= START _INIT_TEAMS =================================
 
         # --- PLAYER LEADER (custom Pokémon) ---
-        species_bulbasaur = get_species_by_number(self.pkmn, 1)
-        pkmn_player = create_pokemon_from_species(species_bulbasaur, level=99)
+        pkmn_player = create_pokemon_from_species(1, level=99)
         pkmn_player.name = "Kobe"
         pkmn_player.pokedex_number = PLAYER_DEX_NO
         player_moves = [
@@ -572,8 +642,7 @@ class BattleState(GameState):
         self.player_team = [pkmn_player]
 
         for _ in range(3):
-            species = get_species_by_number(self.pkmn, random.randint(1, 392))
-            p = create_pokemon_from_species(species)
+            p = create_pokemon_from_species(random.randint(1, 392))
             p.moves = player_moves[:]
 
             # Back sprites
@@ -584,12 +653,11 @@ class BattleState(GameState):
 
             self.player_team.append(p)
 
-        enemy_moves = ["Attack", "Agi", "Bufu", "Zio", "Zan", "Hama", "Mudo"]
+        enemy_moves = list(ENEMY_MOVES)
 
         self.enemy_team = []
         for _ in range(4):
-            species = get_species_by_number(self.pkmn, random.randint(1, 392))
-            p = create_pokemon_from_species(species)
+            p = create_pokemon_from_species(random.randint(1, 392))
             p.moves = enemy_moves[:]
 
             # Front sprites
@@ -601,21 +669,72 @@ class BattleState(GameState):
             self.enemy_team.append(p)
         # ========================= END _INIT_TEAMS =================================
 
+    def _next_living(self, team, index):
+        """
+        First member of team from index on (wrapping) that can still act,
+        or None if the whole team has fainted (see _end_if_wiped).
+        """
+        for step in range(len(team)):
+            i = (index + step) % len(team)
+            if team[i].remaining_hp > 0:
+                return i
+        return None
+
+    def _end_if_wiped(self):
+        """
+        If either side has no one left standing, announce it and end the
+        battle (STATE_BATTLE_END). True if the battle is over.
+        """
+        if self._next_living(self.player_team, 0) is None:
+            text = TEXT_PLAYER_WIPED
+        elif self._next_living(self.enemy_team, 0) is None:
+            text = TEXT_ENEMY_WIPED
+        else:
+            return False
+
+        self.next_state.push(STATE_BATTLE_END)
+        self.next_text.push((text,
+                             True,
+                             False,
+                             False,
+                             False,
+                             False))
+        self.pending_state = STATE_SCROLL
+        return True
+
+    def _hit_text(self, result, target):
+        """Dialogue for a skill that connected; target is whoever took it."""
+        defender_affinity = result.affinity
+        actual_dealt = min(result.damage, target.remaining_hp)
+        t = ""
+        if defender_affinity == AFFINITY_NEUTRAL:
+            t = f"Dealt {actual_dealt} damage."
+        else:
+            if defender_affinity < AFFINITY_NEUTRAL:
+                t = AFFINITY_TEXT_WEAK
+            elif AFFINITY_RESIST <= defender_affinity < AFFINITY_NULL:
+                t = AFFINITY_TEXT_RESIST
+            elif AFFINITY_NULL <= defender_affinity < AFFINITY_REFLECT:
+                t = AFFINITY_TEXT_NULL
+            elif AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB:
+                t = AFFINITY_TEXT_REFLECT
+            elif defender_affinity >= AFFINITY_ABSORB:
+                t = AFFINITY_TEXT_ABSORB
+                t += f" \n Recovered {actual_dealt} HP."
+            if (defender_affinity < AFFINITY_NEUTRAL
+                or AFFINITY_RESIST <= defender_affinity < AFFINITY_NULL
+                or AFFINITY_REFLECT <= defender_affinity < AFFINITY_ABSORB
+            ):
+                t += f" \n Dealt {actual_dealt} damage."
+        if result.crit:
+            t += f" \n A critical hit!"
+        return t
+
     def _consume_full_turn(self):
-        for i in range(4):
-            if self.press_turns[i] != PRESS_TURN_NULL:
-                self.press_turns[i] = PRESS_TURN_NULL
-                return
-            
+        consume_full_turn(self.press_turns)
+
     def _consume_half_turn(self):
-        for i in range(4):
-            if self.press_turns[i] == PRESS_TURN_SOLID:
-                self.press_turns[i] = PRESS_TURN_FLASH
-                return
-        for i in range(4):
-            if self.press_turns[i] == PRESS_TURN_FLASH:
-                self.press_turns[i] = PRESS_TURN_NULL
-                return
-            
+        consume_half_turn(self.press_turns)
+
     def _consume_wipe_turn(self):
-        self.press_turns = [0, 0, 0, 0]
+        consume_wipe_turn(self.press_turns)
@@ -0,0 +1,103 @@
+# state/frame_profiler.py
+
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ("handle_event", "update", "draw")
+
+
+class FrameProfiler:
+    """
+    Rolling per-frame timings for the active state.
+
+    StateManager reports how long each phase took; a frame is closed
+    after draw(). The last `window` frames are kept so percentiles
+    (p50 / p95 / p99) describe recent behaviour only.
+    """
+
+    def __init__(self, window=300):
+        self.window = window
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.samples["frame"] = deque(maxlen=window)
+
+        # Time accumulated for the frame in progress
+        self.pending = dict.fromkeys(PHASES, 0.0)
+
+        self.overlay_enabled = False
+        self.font = None
+
+    # ---------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------
+    def add(self, phase, seconds):
+        """Add time spent in a phase (handle_event may run several times)."""
+        self.pending[phase] += seconds
+
+    def end_frame(self):
+        """Close the current frame and push its timings into the window."""
+        total = 0.0
+        for phase in PHASES:
+            self.samples[phase].append(self.pending[phase])
+            total += self.pending[phase]
+            self.pending[phase] = 0.0
+        self.samples["frame"].append(total)
+
+    def reset(self):
+        """Forget all samples (e.g. when the active state changes)."""
+        for samples in self.samples.values():
+            samples.clear()
+        self.pending = dict.fromkeys(PHASES, 0.0)
+
+    # ---------------------------------------------------------
+    # Stats
+    # ---------------------------------------------------------
+    def percentiles(self, phase="frame", points=(50, 95, 99)):
+        """Return {point: milliseconds} for the given phase."""
+        ordered = sorted(self.samples[phase])
+        if not ordered:
+            return {p: 0.0 for p in points}
+
+        last = len(ordered) - 1
+        return {p: ordered[round(last * p / 100)] * 1000 for p in points}
+
+    def summary_lines(self):
+        lines = []
+        for phase in ("frame",) + PHASES:
+            pct = self.percentiles(phase)
+            lines.append(
+                f"{phase:<12} p50 {pct[50]:6.2f}  p95 {pct[95]:6.2f}  p99 {pct[99]:6.2f} ms"
+            )
+        return lines
+
+    # ---------------------------------------------------------
+    # Overlay
+    # ---------------------------------------------------------
+    def draw_overlay(self, screen, x=8, y=8):
+        """Draw the percentile table in an opaque box; returns its Rect."""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        rendered = [self.font.render(line, True, (255, 255, 255))
+                    for line in self.summary_lines()]
+        width = max(img.get_width() for img in rendered) + 12
+        height = sum(img.get_height() + 2 for img in rendered) + 10
+
+        box = pygame.Rect(x, y, width, height)
+        screen.fill((0, 0, 0), box)
+
+        ty = y + 5
+        for img in rendered:
+            screen.blit(img, (x + 6, ty))
+            ty += img.get_height() + 2
+
+        return box
+
+
+def timed(profiler, phase, func, *args):
+    """Call func(*args), adding its duration to the profiler's phase."""
+    start = time.perf_counter()
+    result = func(*args)
+    profiler.add(phase, time.perf_counter() - start)
+    return result
@@ -2,7 +2,10 @@
 
 import pygame
 
+from constants import WARP_PRELOAD_DISTANCE
 from state.state_manager import GameState
+from overworld.map import load_map
+from overworld.preloader import MapPreloader
 from overworld.movement import test_movement, update_camera
 
 
@@ -11,29 +14,48 @@ class OverworldState(GameState):
     Handles overworld gameplay: movement, collisions, camera, and map transitions.
     """
 
-    def __init__(self, map_obj, player, screen_width, screen_height, debug_walls_enabled):
+    def __init__(self, map_obj, player, screen_width, screen_height, debug_walls_enabled,
+                 key_source=None):
         self.map = map_obj
         self.player = player
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.debug_walls_enabled = debug_walls_enabled
 
+        # Held-key snapshot provider (scripted input can replace it)
+        self.key_source = key_source or pygame.key.get_pressed
+
         # Movement state
         self.dx = 0
         self.dy = 0
         self.direction = self.player.direction
         self.moving = False
 
+        # Dirty-rect rendering for non-scrolling maps: the static
+        # background is drawn once, then only the player's old and
+        # new rects are restored each frame.
+        self.background = None
+        self.last_player_rect = None
+
+        # Background loading of rooms behind nearby warps
+        self.preloader = MapPreloader(screen_width, screen_height)
+
     # ---------------------------------------------------------
     # State lifecycle
     # ---------------------------------------------------------
     def enter(self):
         """Called when entering the overworld state."""
-        pass
+        # Another state has drawn over the screen
+        self.invalidate()
+
+    def invalidate(self):
+        """Force a full background redraw on the next frame."""
+        self.background = None
 
     def exit(self):
         """Called when leaving the overworld state."""
-        pass
+        # No warps to preload while another state is up
+        self.preloader.shutdown()
 
     # ---------------------------------------------------------
     # Event handling
@@ -50,7 +72,7 @@ class OverworldState(GameState):
     # ---------------------------------------------------------
     def update(self):
         # Get keyboard input
-        keys = pygame.key.get_pressed()
+        keys = self.key_source()
         self.dx, self.dy, self.direction, self.moving = self.player.handle_input(keys)
         self.player.direction = self.direction
 
@@ -58,6 +80,11 @@ class OverworldState(GameState):
         self.dx, self.dy = test_movement(self.map, self.player, self.dx, self.dy)
         self.player.update(self.dx, self.dy, self.direction, self.moving)
 
+        # Preload the destination of any warp the player is close to,
+        # and hand finished background loads over to the map cache
+        self.preload_nearby_warps()
+        self.preloader.poll()
+
         # Warp transitions
         warp = self.map.check_warp(
             self.player.x,
@@ -67,8 +94,8 @@ class OverworldState(GameState):
         )
 
         if warp is not None:
-            # Load new map
-            self.map = self.map.__class__(
+            # Load new map (cached after the first visit)
+            self.map = load_map(
                 warp["to_room"],
                 self.screen_width,
                 self.screen_height
@@ -82,13 +109,60 @@ class OverworldState(GameState):
             if warp.get("dest_facing") is not None:
                 self.player.direction = warp["dest_facing"]
 
+            self.invalidate()
+
         # Update camera
         update_camera(self.map, self.player, self.screen_width, self.screen_height)
 
+    def preload_nearby_warps(self):
+        d = WARP_PRELOAD_DISTANCE
+        nearby = self.map.check_regions(
+            self.player.x - d,
+            self.player.y - d,
+            self.player.width + 2 * d,
+            self.player.height + 2 * d,
+            "warp"
+        )
+        for _, warp in nearby:
+            self.preloader.request(warp["to_room"])
+
     # ---------------------------------------------------------
     # Drawing
     # ---------------------------------------------------------
     def draw(self, screen):
-        screen.fill((0, 0, 0))
-        self.map.draw(screen, self.debug_walls_enabled)
+        if self.map.scrolling:
+            screen.fill((0, 0, 0))
+            self.map.draw(screen, self.debug_walls_enabled)
+            self.player.draw(screen, self.map.camera_x, self.map.camera_y)
+            return None
+
+        return self.draw_dirty(screen)
+
+    def draw_dirty(self, screen):
+        """
+        Camera is pinned, so the map never changes on screen. Redraw the
+        full background only when it was invalidated; otherwise restore
+        and redraw just the player's previous and current rects.
+        """
+        player_rect = self.player.current_frame.get_rect(
+            topleft=(int(self.player.x - self.map.camera_x),
+                     int(self.player.y - self.map.camera_y))
+        )
+
+        if self.background is None or self.background.get_size() != screen.get_size():
+            self.background = pygame.Surface(screen.get_size()).convert()
+            self.background.fill((0, 0, 0))
+            self.map.draw(self.background, self.debug_walls_enabled)
+
+            screen.blit(self.background, (0, 0))
+            self.player.draw(screen, self.map.camera_x, self.map.camera_y)
+            self.last_player_rect = player_rect
+            return None
+
+        dirty = [self.last_player_rect, player_rect]
+        for rect in dirty:
+            screen.blit(self.background, rect, area=rect)
         self.player.draw(screen, self.map.camera_x, self.map.camera_y)
+
+        self.last_player_rect = player_rect
+        return dirty
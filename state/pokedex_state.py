@@ -61,6 +61,7 @@ class PokedexState(GameState):
     def draw(self, screen):
         """
         Draw the Pokédex UI.
+        The view's cached panel is opaque and covers the whole screen,
+        so there is no separate clear.
         """
-        screen.fill((0, 0, 0))
         self.view.draw(screen)
@@ -1,5 +1,7 @@
 # state/state_manager.py
 
+from state.frame_profiler import FrameProfiler, timed
+
 class GameState:
     """
     Base class for all game states.
@@ -9,8 +11,17 @@ class GameState:
         - handle_event(event)
         - update()
         - draw(screen)
+        - invalidate()
+
+    draw() may return a list of pygame.Rects that changed this frame;
+    returning None (the default) means the whole screen was redrawn.
+
+    A state leaves on its own by setting change_request to the name of
+    another registered state; the StateManager switches after update().
     """
 
+    change_request = None
+
     def enter(self):
         pass
 
@@ -26,6 +37,10 @@ class GameState:
     def draw(self, screen):
         pass
 
+    def invalidate(self):
+        """Something else drew over the screen; redraw it fully next frame."""
+        pass
+
 
 class StateManager:
     """
@@ -33,48 +48,105 @@ class StateManager:
     """
 
     def __init__(self):
-        self.states = {}     # name → GameState instance
+        self.states = {}     # name → GameState instance (once built)
+        self.factories = {}  # name → callable returning a GameState
         self.current = None  # currently active state
 
+        # Per-frame handle_event / update / draw timings of the active state
+        self.profiler = FrameProfiler()
+
     def register(self, name, state):
         """
-        Register a state instance under a name.
+        Register a state under a name, either as an instance or as a
+        factory (any callable returning a GameState). Factories are only
+        called on the first change() to that state.
         Example:
             state_manager.register("overworld", OverworldState(...))
+            state_manager.register("battle", BattleState)
         """
-        self.states[name] = state
+        if isinstance(state, GameState):
+            self.states[name] = state
+            self.factories.pop(name, None)
+        else:
+            self.factories[name] = state
+            self.states.pop(name, None)
+
+    def get(self, name):
+        """Return the state registered under name, building it if needed."""
+        if name not in self.states:
+            if name not in self.factories:
+                raise ValueError(f"State '{name}' is not registered.")
+            self.states[name] = self.factories.pop(name)()
+        return self.states[name]
+
+    def is_active(self, name):
+        """True if the state registered under name is the current one."""
+        return self.current is not None and self.current is self.states.get(name)
 
     def change(self, name):
         """
         Switch to a different registered state.
         Calls exit() on the old state and enter() on the new one.
         """
-        if name not in self.states:
-            raise ValueError(f"State '{name}' is not registered.")
+        state = self.get(name)
 
         if self.current:
             self.current.exit()
 
-        self.current = self.states[name]
+        self.current = state
         self.current.enter()
 
+        # Timings only describe the state that is active now
+        self.profiler.reset()
+
+    def shutdown(self):
+        """
+        Leave the current state (calls its exit()), so background
+        workers stop before the game quits.
+        """
+        if self.current:
+            self.current.exit()
+            self.current = None
+
+    def toggle_profiler_overlay(self):
+        """Show/hide the frame-time overlay."""
+        self.profiler.overlay_enabled = not self.profiler.overlay_enabled
+        if self.current:
+            self.current.invalidate()
+
     def handle_event(self, event):
         """
         Forward events to the active state.
         """
         if self.current:
-            self.current.handle_event(event)
+            timed(self.profiler, "handle_event", self.current.handle_event, event)
 
     def update(self):
         """
         Update the active state.
         """
         if self.current:
-            self.current.update()
+            timed(self.profiler, "update", self.current.update)
+
+            name = self.current.change_request
+            if name is not None:
+                self.current.change_request = None
+                self.change(name)
 
     def draw(self, screen):
         """
         Draw the active state.
+        Returns the state's dirty rects, or None for a full-screen update.
+        Closes the profiler frame.
         """
+        dirty_rects = None
         if self.current:
-            self.current.draw(screen)
+            dirty_rects = timed(self.profiler, "draw", self.current.draw, screen)
+        self.profiler.end_frame()
+
+        if self.profiler.overlay_enabled:
+            overlay_rect = self.profiler.draw_overlay(screen)
+            if dirty_rects is not None:
+                dirty_rects = dirty_rects + [overlay_rect]
+
+        return dirty_rects